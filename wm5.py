@@ -24,11 +24,21 @@ def set_app_icon(window, icon_path=None):
             pass  # Don't break if icon fails to load
 
 from tkinter import ttk, messagebox, filedialog
+import numpy as np
 import pandas as pd
 import pyodbc
 from pathlib import Path
+from functools import lru_cache
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
+try:
+    import pyarrow  # noqa: F401  (optional: native string kernels for text columns)
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXT_DTYPE = "string"
+
 # ============================================================
 # CONFIG
 # ============================================================
@@ -71,9 +81,46 @@ ENTRY_FIELDS = ["Well Name", "Lateral Length", "Value Navigator UWI", "Pad Name"
 # Editable fields in the grid
 EDITABLE_FIELDS = ENTRY_FIELDS + DROPDOWN_FIELDS
 
+# Fields that make up "Composite name" (Well - Layer - Tech)
+COMPOSITE_PARTS = ["Well Name", "Layer Producer", "Completions Technology"]
+
+# Free-text columns held as pandas string dtype after load
+TEXT_FIELDS = ENTRY_FIELDS + ["Composite name"]
+
+# Rows fetched per round trip when loading the table (bounds peak memory)
+READ_CHUNK_ROWS = 50_000
+
 # Optional keyboard affordance: Space toggles ✓ for complete rows
 ENABLE_SPACE_TOGGLE = True
 
+# Current Wells row height (px); also sizes the virtualized row window
+TREE_ROW_HEIGHT = 32
+
+# Add New row height (px) assumed until the first pooled row has been laid out
+ADD_ROW_HEIGHT = 36
+
+# Current Wells column layout: calmer, consistent widths; stretch long text columns
+ColumnSpec = namedtuple("ColumnSpec", "width minwidth stretch anchor")
+DEFAULT_COLUMN_SPEC = ColumnSpec(160, 100, False, "w")
+COLUMN_SPEC = {
+    "Select":                 ColumnSpec(64, 32, False, "center"),
+    "ID":                     ColumnSpec(40, 56, False, "w"),
+    "GasIDREC":               ColumnSpec(260, 220, False, "w"),
+    "PressuresIDREC":         ColumnSpec(260, 220, False, "w"),
+    "Well Name":              ColumnSpec(220, 160, True, "w"),
+    "Formation Producer":     ColumnSpec(160, 140, False, "w"),
+    "Layer Producer":         ColumnSpec(160, 140, False, "w"),
+    "Fault Block":            ColumnSpec(140, 120, False, "w"),
+    "Pad Name":               ColumnSpec(160, 140, True, "w"),
+    "Completions Technology": ColumnSpec(180, 160, False, "w"),
+    "Lateral Length":         ColumnSpec(120, 96, False, "w"),
+    "Value Navigator UWI":    ColumnSpec(200, 160, True, "w"),
+    "Composite name":         ColumnSpec(260, 200, True, "w"),
+}
+
+# How often (ms) the Tk thread checks on a running Access job
+IO_POLL_MS = 50
+
 
 # ============================================================
 # DATA ACCESS LAYER
@@ -89,145 +136,521 @@ def connect_access(db_path: str):
         raise FileNotFoundError(f"Database file not found: {db_path}")
     if not p.is_file():
         raise ValueError(f"Path is not a file: {db_path}")
-    
+
     conn_str = (
         r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
         rf"DBQ={db_path};"
         r"UID=Admin;PWD=;"
     )
     try:
-        return pyodbc.connect(conn_str)
+        # Explicit transactions: writers batch their statements and commit once
+        return pyodbc.connect(conn_str, autocommit=False)
     except pyodbc.Error as e:
         raise ConnectionError(f"Failed to connect to database: {e}")
 
 
-def load_access_table(db_path: str, table_name: str) -> pd.DataFrame:
+# The GUI's long-lived connection: (db_path, connection)
+_CONN: tuple | None = None
+
+
+def get_conn(db_path: str):
+    """
+    Return the session's shared connection to db_path, opening it on first
+    use, after a database path change, or when the old handle has gone bad.
+    Use it as `with get_conn(path) as conn:` -- the block commits on success
+    and rolls back on error, but leaves the connection open.
+    """
+    global _CONN
+    if _CONN is not None:
+        path, conn = _CONN
+        if path == db_path:
+            try:
+                conn.cursor().close()
+                return conn
+            except pyodbc.Error:
+                log("[DB] Shared connection is unusable; reconnecting")
+        close_conn()
+    conn = connect_access(db_path)
+    _CONN = (db_path, conn)
+    return conn
+
+
+def close_conn():
+    """Close the shared connection, if one is open."""
+    global _CONN
+    if _CONN is not None:
+        try:
+            _CONN[1].close()
+        except pyodbc.Error:
+            pass
+        _CONN = None
+
+
+# (db_path, table_name) -> (file mtime, DataFrame) from the last load, least recently used first
+_TABLE_CACHE: dict[tuple[str, str], tuple[float, pd.DataFrame]] = {}
+TABLE_CACHE_MAX = 4  # tables kept in memory across DB/table switches
+
+
+def invalidate_table_cache(db_path: str):
+    """
+    Drop cached tables for a database. Call after committing writes: Access
+    doesn't always bump the file mtime while a connection is still open.
+    """
+    for key in [k for k in _TABLE_CACHE if k[0] == db_path]:
+        del _TABLE_CACHE[key]
+    for key in [k for k in _DROPDOWN_CACHE if k[0] == db_path]:
+        del _DROPDOWN_CACHE[key]
+
+
+def load_access_table(db_path: str, table_name: str, force: bool = False) -> pd.DataFrame:
     """
-    Load the full Access table as a pandas DataFrame.
+    Load the TABLE_COLUMNS of the Access table as a pandas DataFrame.
     Ordered by ID ascending (stable order, newest at bottom).
+    Served from memory when the file hasn't changed since the last load, unless
+    force=True: the mtime can lag other users' writes to a shared database.
     """
     p = Path(db_path)
     if not p.exists():
         raise FileNotFoundError(f"DB path not found: {db_path}")
-    try:
-        from datetime import datetime
-        log(f"[DB] Using: {p}  (modified: {datetime.fromtimestamp(p.stat().st_mtime)})")
-    except Exception:
-        pass
-
-    try:
-        with connect_access(db_path) as conn:
-            try:
-                cur = conn.cursor()
-                cur.execute(f"SELECT COUNT(*) FROM [{table_name}]")
-                total = cur.fetchone()[0]
-                log(f"[DB] Row count in Access right now: {total}")
-            except Exception as e:
-                log(f"[DB] Could not get row count: {e}")
+    mtime = p.stat().st_mtime
+    if DEBUG_DB:
+        try:
+            from datetime import datetime
+            log(f"[DB] Using: {p}  (modified: {datetime.fromtimestamp(mtime)})")
+        except Exception:
+            pass
 
-            df = pd.read_sql(f"SELECT * FROM [{table_name}] ORDER BY ID ASC", conn)
+    cached = _TABLE_CACHE.pop((db_path, table_name), None)
+    if force:
+        _DROPDOWN_CACHE.pop((db_path, table_name, mtime), None)
+    elif cached is not None and cached[0] == mtime:
+        log("[DB] File unchanged since last load; using cached table")
+        _TABLE_CACHE[(db_path, table_name)] = cached  # re-insert as most recently used
+        return cached[1].copy()
+    # Fresh read from disk: rows may have been deleted or re-keyed outside the app
+    clear_id_cache(db_path)
 
-            try:
-                tail = df[["ID", "Well Name"]].tail(5)
-                log("[DB] Tail IDs just loaded:\n" + tail.to_string(index=False))
-            except Exception:
-                pass
+    try:
+        with get_conn(db_path) as conn:
+            # Diagnostic only: COUNT(*) is a full scan on Access, so don't send it in normal runs
+            if DEBUG_DB:
+                try:
+                    cur = conn.cursor()
+                    cur.execute(f"SELECT COUNT(*) FROM [{table_name}]")
+                    total = cur.fetchone()[0]
+                    log(f"[DB] Row count in Access right now: {total}")
+                except Exception as e:
+                    log(f"[DB] Could not get row count: {e}")
+
+            # Only the columns the GUI knows about; extra/memo columns never cross ODBC.
+            # Plain cursor + fetchmany: no read_sql wrapper (or its DBAPI warning) per load.
+            cols_sql = ", ".join(f"[{c}]" for c in TABLE_COLUMNS)
+            cur = conn.cursor()
+            cur.execute(f"SELECT {cols_sql} FROM [{table_name}]")
+            cols = [d[0] for d in cur.description]
+            frames = []
+            while True:
+                rows = cur.fetchmany(READ_CHUNK_ROWS)
+                if not rows:
+                    break
+                frames.append(pd.DataFrame.from_records([tuple(r) for r in rows], columns=cols, coerce_float=True))
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=cols)
+            # Sort here instead of ORDER BY so Access can stream rows; the
+            # AutoNumber column comes back nearly sorted, which mergesort handles in ~O(N)
+            df.sort_values("ID", kind="mergesort", ignore_index=True, inplace=True)
+
+            if DEBUG_DB:
+                try:
+                    tail = zip(df["ID"].tail(5), df["Well Name"].tail(5))
+                    log("[DB] Tail IDs just loaded:\n" + "\n".join(f"{i}  {w}" for i, w in tail))
+                except Exception:
+                    pass
 
-        return df
+        # Low-cardinality dropdown columns: categorical gives the unique set for free
+        for col in DROPDOWN_FIELDS:
+            if col in df.columns:
+                df[col] = df[col].astype(TEXT_DTYPE).str.strip().replace("", pd.NA).astype("category")
+        # Text columns: string dtype so .str ops run natively (numeric columns are left alone)
+        for col in TEXT_FIELDS:
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = df[col].astype(TEXT_DTYPE)
+
+        prime_id_cache(db_path, table_name, df)
+        df.attrs["source"] = (db_path, table_name, mtime)  # cache key for get_unique_options
+        _TABLE_CACHE[(db_path, table_name)] = (mtime, df)
+        while len(_TABLE_CACHE) > TABLE_CACHE_MAX:
+            del _TABLE_CACHE[next(iter(_TABLE_CACHE))]
+        return df.copy()
     except Exception as e:
         raise RuntimeError(f"Failed to load table '{table_name}': {e}")
 
 
-def get_unique_options(df: pd.DataFrame) -> dict:
+# (db_path, table_name, file mtime) -> get_unique_options result for that load
+_DROPDOWN_CACHE: dict[tuple[str, str, float], dict] = {}
+
+
+def get_unique_options(df: pd.DataFrame, cache_key: tuple | None = None) -> dict:
     """
     Build unique sorted lists for each dropdown column from the current data.
+    With cache_key (df.attrs["source"] of a freshly loaded table) the result is
+    reused until that table changes; leave it out once df has been edited.
     """
+    if cache_key is not None and cache_key in _DROPDOWN_CACHE:
+        return _DROPDOWN_CACHE[cache_key]
     options = {}
     for col in DROPDOWN_FIELDS:
-        if col in df.columns:
-            vals = (
-                df[col]
-                .dropna()
-                .astype(str)
-                .map(str.strip)
-                .replace({"": None})
-                .dropna()
-                .unique()
-            )
-            options[col] = sorted(vals)
-        else:
+        if col not in df.columns:
             options[col] = []
+        elif isinstance(df[col].dtype, pd.CategoricalDtype):
+            # Already stripped/blank-free at load time; only drop values no row uses anymore
+            options[col] = sorted(df[col].cat.remove_unused_categories().cat.categories.tolist())
+        else:
+            # Dedupe the raw values first so strip only runs once per distinct value
+            raw = pd.unique(df[col].dropna().to_numpy(dtype=object))
+            options[col] = sorted({str(v).strip() for v in raw} - {""})
+    if cache_key is not None:
+        _DROPDOWN_CACHE[cache_key] = options
     return options
 
 
-def insert_records(conn, table_name: str, rows: list[dict]):
+# SQLSTATEs a driver reports when it can't bind parameter arrays
+_NO_PARAM_ARRAY_STATES = {"HYC00", "HY092", "IM001"}
+
+# Write-side column lists and INSERT text, fixed by TABLE_COLUMNS; only the table name varies
+_INSERT_COLS = tuple(c for c in TABLE_COLUMNS if c != AUTONUMBER_FIELD)
+_SQL_INSERT = "INSERT INTO [{{table}}] ({cols}) VALUES ({marks})".format(
+    cols=", ".join(f"[{c}]" for c in _INSERT_COLS),
+    marks=", ".join(["?"] * len(_INSERT_COLS)),
+)
+_UPDATABLE_COLS = tuple(c for c in TABLE_COLUMNS if c not in (AUTONUMBER_FIELD, "GasIDREC", "PressuresIDREC"))
+
+
+def _executemany(cur, sql: str, params_batch: list[tuple]):
+    """
+    executemany with pyodbc's parameter arrays (fast_executemany) when the
+    driver supports them; otherwise fall back to the row-at-a-time path.
+    """
+    try:
+        cur.fast_executemany = True
+    except AttributeError:
+        cur.executemany(sql, params_batch)
+        return
+    try:
+        cur.executemany(sql, params_batch)
+    except pyodbc.Error as e:
+        if not e.args or e.args[0] not in _NO_PARAM_ARRAY_STATES:
+            raise
+        log(f"[DB] fast_executemany unsupported ({e.args[0]}); using row-at-a-time executemany")
+        cur.fast_executemany = False
+        cur.executemany(sql, params_batch)
+
+
+def insert_records(conn, table_name: str, rows: list[dict], cur=None):
     """
     Batch insert (ID omitted). Each row is a dict mapping column -> value.
+
+    Access SQL has no multi-row VALUES list, so the whole batch goes through
+    one prepared statement on a single cursor. Does not commit: the caller
+    owns the transaction and commits once for the whole user action.
     """
     if not rows:
         return
-    
-    insert_cols = [c for c in TABLE_COLUMNS if c != AUTONUMBER_FIELD]
-    placeholders = ", ".join(["?"] * len(insert_cols))
-    col_list = ", ".join([f"[{c}]" for c in insert_cols])
-    sql = f"INSERT INTO [{table_name}] ({col_list}) VALUES ({placeholders})"
 
-    cur = conn.cursor()
-    params_batch = [[row.get(c, None) for c in insert_cols] for row in rows]
-    cur.executemany(sql, params_batch)
-    conn.commit()
+    if cur is None:
+        cur = conn.cursor()
+    params_batch = [tuple(map(row.get, _INSERT_COLS)) for row in rows]  # C-level per-row gather
+    _executemany(cur, _SQL_INSERT.format(table=table_name), params_batch)
+
 
+# Lookup SQL, prepared once; only the user-selected table name is filled in per call
+_SQL_FIND_IN = "SELECT ID, GasIDREC, PressuresIDREC FROM [{table}] WHERE [{col}] IN ({marks})"
+_SQL_WELL_NAMES_IN = "SELECT [Well Name] FROM [{table}] WHERE [Well Name] IN ({marks})"
 
-def find_existing_id(conn, table_name: str, gas_id: str | None, pres_id: str | None):
+# Max parameters per IN (...) list sent to Access
+MAX_IN_PARAMS = 200
+
+
+def find_existing_ids(conn, table_name: str, pairs, cur=None) -> dict[tuple, int]:
     """
-    Return the ID of a row that matches the provided identifiers.
-    Prefer matching BOTH (GasIDREC AND PressuresIDREC) when both are given;
-    fall back to a single-column match only if one is missing.
+    Resolve many (GasIDREC, PressuresIDREC) pairs to row IDs with one IN (...)
+    query per chunk. Matches on BOTH ids when both are given, otherwise on the
+    one that is present; pairs with no match are left out of the result.
     """
-    cur = conn.cursor()
-    if gas_id and pres_id:
-        cur.execute(
-            f"SELECT ID FROM [{table_name}] WHERE GasIDREC = ? AND PressuresIDREC = ?",
-            (gas_id, pres_id),
-        )
-    elif gas_id:
-        cur.execute(f"SELECT ID FROM [{table_name}] WHERE GasIDREC = ?", (gas_id,))
-    elif pres_id:
-        cur.execute(f"SELECT ID FROM [{table_name}] WHERE PressuresIDREC = ?", (pres_id,))
-    else:
-        return None
-    row = cur.fetchone()
-    return row[0] if row else None
+    pairs = list(pairs)
+    gas_ids = sorted({g for g, _p in pairs if g})
+    pres_ids = sorted({p for g, p in pairs if p and not g})
+
+    by_pair: dict[tuple, int] = {}
+    by_gas: dict[str, int] = {}
+    by_pres: dict[str, int] = {}
+    if cur is None:
+        cur = conn.cursor()
+    for col, keys in (("GasIDREC", gas_ids), ("PressuresIDREC", pres_ids)):
+        for i in range(0, len(keys), MAX_IN_PARAMS):
+            chunk = keys[i:i + MAX_IN_PARAMS]
+            marks = ", ".join(["?"] * len(chunk))
+            cur.execute(_SQL_FIND_IN.format(table=table_name, col=col, marks=marks), chunk)
+            for rec_id, gas, pres in cur.fetchall():
+                gas, pres = str(gas or ""), str(pres or "")
+                by_pair.setdefault((gas, pres), rec_id)
+                by_gas.setdefault(gas, rec_id)
+                by_pres.setdefault(pres, rec_id)
+
+    found = {}
+    for g, p in pairs:
+        if g and p:
+            rec_id = by_pair.get((g, p))
+        elif g:
+            rec_id = by_gas.get(g)
+        elif p:
+            rec_id = by_pres.get(p)
+        else:
+            rec_id = None
+        if rec_id is not None:
+            found[(g, p)] = rec_id
+    return found
+
+
+# (db_path, table_name, GasIDREC, PressuresIDREC) -> Access ID, hits only
+_ID_CACHE: dict[tuple[str, str, str, str], int] = {}
 
 
-def update_record(conn, table_name: str, rec_id: int, payload: dict):
+def clear_id_cache(db_path: str):
+    """Forget cached ID lookups for a database."""
+    for key in [k for k in _ID_CACHE if k[0] == db_path]:
+        del _ID_CACHE[key]
+
+
+def prime_id_cache(db_path: str, table_name: str, df: pd.DataFrame):
+    """
+    Seed the ID cache from a freshly loaded table, so Save / Update only go
+    to Access for pairs the load didn't see. Exact (GasIDREC, PressuresIDREC)
+    pairs only; one-sided lookups keep their query-time matching rules.
+    """
+    if not {"ID", "GasIDREC", "PressuresIDREC"} <= set(df.columns):
+        return
+    gas = df["GasIDREC"].fillna("").astype(TEXT_DTYPE).to_numpy(dtype=object)
+    pres = df["PressuresIDREC"].fillna("").astype(TEXT_DTYPE).to_numpy(dtype=object)
+    ids = df["ID"].to_numpy()
+    keep = np.flatnonzero((gas != "") & (pres != "") & df["ID"].notna().to_numpy())
+    # Reversed so the lowest ID wins on a duplicated pair, like the first match from Access
+    for i in keep[::-1]:
+        _ID_CACHE[(db_path, table_name, gas[i], pres[i])] = int(ids[i])
+
+
+def lookup_ids(conn, db_path: str, table_name: str, pairs, cur=None) -> dict[tuple, int]:
+    """
+    find_existing_ids with an in-session cache: only pairs not seen before
+    go to Access. Misses aren't cached, so rows inserted later still match.
+    """
+    found = {}
+    missing = set()
+    for pair in pairs:
+        rec_id = _ID_CACHE.get((db_path, table_name, *pair))
+        if rec_id is None:
+            missing.add(pair)
+        else:
+            found[pair] = rec_id
+    if missing:
+        fetched = find_existing_ids(conn, table_name, missing, cur)
+        for pair, rec_id in fetched.items():
+            _ID_CACHE[(db_path, table_name, *pair)] = rec_id
+        found.update(fetched)
+    return found
+
+
+def find_existing_well_names(conn, table_name: str, names, cur=None) -> set[str]:
+    """
+    Return the subset of `names` already present in the Well Name column,
+    using one IN (...) query per chunk instead of one COUNT per name.
+    """
+    names = sorted({n for n in names if n})
+    existing: set[str] = set()
+    if cur is None:
+        cur = conn.cursor()
+    for i in range(0, len(names), MAX_IN_PARAMS):
+        chunk = names[i:i + MAX_IN_PARAMS]
+        marks = ", ".join(["?"] * len(chunk))
+        cur.execute(_SQL_WELL_NAMES_IN.format(table=table_name, marks=marks), chunk)
+        existing.update(row[0] for row in cur.fetchall())
+    return existing
+
+
+def update_record(conn, table_name: str, rec_id: int, payload: dict, cur=None):
     """
     Update selected columns by ID. GasIDREC/PressuresIDREC remain unchanged.
+    Does not commit; the caller commits once per batch.
     """
-    updatable_cols = [c for c in TABLE_COLUMNS if c not in (AUTONUMBER_FIELD, "GasIDREC", "PressuresIDREC")]
-    sets, params = [], []
-    for c in updatable_cols:
-        if c in payload:
-            sets.append(f"[{c}] = ?")
-            params.append(payload.get(c))
-    if not sets:
+    cols = tuple(c for c in _UPDATABLE_COLS if c in payload)
+    if not cols:
         return
-    params.append(rec_id)
-    sql = f"UPDATE [{table_name}] SET {', '.join(sets)} WHERE ID = ?"
-    cur = conn.cursor()
-    cur.execute(sql, params)
+    if cur is None:
+        cur = conn.cursor()
+    cur.execute(build_update_sql(table_name, cols), [payload[c] for c in cols] + [rec_id])
+
 
+def build_update_sql(table_name: str, cols) -> str:
+    """UPDATE ... SET the given columns (in order) WHERE ID = ?; ID is the last parameter."""
+    sets = ", ".join(f"[{c}] = ?" for c in cols)
+    return f"UPDATE [{table_name}] SET {sets} WHERE ID = ?"
 
+
+def bulk_update_records(conn, table_name: str, payloads: list[tuple[int, dict]], cur=None):
+    """
+    Update many rows by ID in as few round trips as possible.
+    Payloads that touch the same columns share one UPDATE statement, sent
+    through a single executemany. GasIDREC/PressuresIDREC remain unchanged.
+    Does not commit; the caller commits once per batch.
+    """
+    groups: dict[tuple, list[tuple]] = {}
+    for rec_id, payload in payloads:
+        cols = tuple(c for c in _UPDATABLE_COLS if c in payload)
+        if cols:
+            groups.setdefault(cols, []).append(tuple(payload[c] for c in cols) + (rec_id,))
+    if not groups:
+        return
+
+    if cur is None:
+        cur = conn.cursor()
+    for cols, params_batch in groups.items():
+        _executemany(cur, build_update_sql(table_name, cols), params_batch)
+
+
+def save_edits(db_path: str, table_name: str, edits: list[tuple], report=None):
+    """
+    Write Current Wells edits to Access in one transaction.
+    edits: (iid, rec_id, gas, pres, payload) tuples; a None rec_id is looked up
+    from the (GasIDREC, PressuresIDREC) pair. report(text), if given, gets
+    progress messages (called from this thread).
+    Returns (saved, failed, errors) where saved lists the (iid, rec_id) written.
+    """
+    saved: list[tuple[str, int]] = []
+    failed = 0
+    errors = []
+
+    with get_conn(db_path) as conn:
+        cur = conn.cursor()  # one statement handle for the whole transaction
+        batch: list[tuple[str, int, dict]] = []  # (iid, rec_id, payload)
+        # Rows without an Access ID: resolve all their pairs in one batched lookup
+        id_by_pair = lookup_ids(
+            conn, db_path, table_name, {(gas, pres) for _iid, rec_id, gas, pres, _p in edits if rec_id is None}, cur
+        )
+        for iid, rec_id, gas, pres, payload in edits:
+            # Find Access row ID
+            if rec_id is None:
+                rec_id = id_by_pair.get((gas, pres))
+
+            if not rec_id:
+                failed += 1
+                errors.append(f"Row {iid}: Record not found")
+                continue
+            batch.append((iid, rec_id, payload))
+
+        try:
+            bulk_update_records(conn, table_name, [(rec_id, p) for _iid, rec_id, p in batch], cur)
+            saved.extend((iid, rec_id) for iid, rec_id, _p in batch)
+        except Exception:
+            # Retry row by row so the report names the failing rows
+            for n, (iid, rec_id, payload) in enumerate(batch, start=1):
+                if report:
+                    report(f"Saving {n}/{len(batch)}…")
+                try:
+                    update_record(conn, table_name, rec_id, payload, cur)
+                    saved.append((iid, rec_id))
+                except Exception as e:
+                    failed += 1
+                    errors.append(f"Row {iid}: {str(e)}")
+
+        conn.commit()
+    invalidate_table_cache(db_path)
+    return saved, failed, errors
+
+
+def fetch_existing_well_names(db_path: str, table_name: str, names) -> set[str]:
+    """find_existing_well_names on the shared connection, for worker-thread use."""
+    with get_conn(db_path) as conn:
+        return find_existing_well_names(conn, table_name, names)
+
+
+def upsert_staged_rows(db_path: str, table_name: str, rows: list[dict], report=None):
+    """
+    Write Add New rows to Access in one transaction: rows whose
+    (GasIDREC, PressuresIDREC) pair already exists are updated, the rest inserted.
+    report(text), if given, gets progress messages (called from this thread).
+    Returns (updated, inserted, processed_pairs, errors); processed_pairs is a set.
+    """
+    updated = 0
+    inserted = 0
+    processed_pairs: set[tuple] = set()
+    errors = []
+
+    with get_conn(db_path) as conn:
+        cur = conn.cursor()  # one statement handle for the whole transaction
+        to_insert = []
+        to_update = []  # (rec_id, payload, pair)
+        pairs = [(str(r.get("GasIDREC") or ""), str(r.get("PressuresIDREC") or "")) for r in rows]
+        existing_ids = lookup_ids(conn, db_path, table_name, pairs, cur)
+        for r, pair in zip(rows, pairs):
+            rec_id = existing_ids.get(pair)
+            if rec_id:
+                to_update.append((rec_id, r, pair))
+            else:
+                to_insert.append((r, pair))
+
+        if to_update:
+            if report:
+                report(f"Updating {len(to_update)} row(s)…")
+            try:
+                bulk_update_records(conn, table_name, [(rec_id, r) for rec_id, r, _pair in to_update], cur)
+                updated += len(to_update)
+                processed_pairs.update(pair for _rec_id, _r, pair in to_update)
+            except Exception:
+                # Retry row by row so the report names the failing pairs
+                for n, (rec_id, r, pair) in enumerate(to_update, start=1):
+                    if report:
+                        report(f"Updating {n}/{len(to_update)}…")
+                    try:
+                        update_record(conn, table_name, rec_id, r, cur)
+                        updated += 1
+                        processed_pairs.add(pair)
+                    except Exception as e:
+                        errors.append(f"Update failed for {pair}: {e}")
+                        # Continue with other rows
+
+        if to_insert:
+            if report:
+                report(f"Inserting {len(to_insert)} row(s)…")
+            try:
+                insert_records(conn, table_name, [r for r, _pair in to_insert], cur)
+                inserted += len(to_insert)
+                processed_pairs.update(pair for _r, pair in to_insert)
+            except Exception as e:
+                errors.append(f"Insert failed: {e}")
+                # Don't raise, report errors at the end
+        conn.commit()
+    invalidate_table_cache(db_path)
+    return updated, inserted, processed_pairs, errors
+
+
+@lru_cache(maxsize=4096)
 def compose_name(well: str | None, layer: str | None, tech: str | None) -> str | None:
     """
     Return "Well - Layer - Tech" if all three are present; otherwise None.
+    Memoized: the editors call this on every keystroke with mostly repeated triples.
+    """
+    parts = ((well or "").strip(), (layer or "").strip(), (tech or "").strip())
+    return " - ".join(parts) if all(parts) else None
+
+
+def compose_name_vec(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorised compose_name over the COMPOSITE_PARTS columns of df.
+    Returns an object Series holding None where any part is blank.
     """
-    w = (well or "").strip()
-    l = (layer or "").strip()
-    t = (tech or "").strip()
-    if not (w and l and t):
-        return None
-    return f"{w} - {l} - {t}"
+    # Cast before fillna: the loaded dropdown parts are categoricals, which reject a new "" value
+    w, l, t = (df[c].astype(TEXT_DTYPE).fillna("").str.strip() for c in COMPOSITE_PARTS)
+    mask = w.ne("") & l.ne("") & t.ne("")
+    return (w + " - " + l + " - " + t).astype(object).where(mask, None)
 
 
 # ============================================================
@@ -255,7 +678,19 @@ class XYScrollFrame(ttk.Frame):
         self.grid_columnconfigure(0, weight=1)
 
         self.canvas_window = self.canvas.create_window((0, 0), window=self.viewPort, anchor="nw")
-        self.viewPort.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        # Children resizing during a build fire <Configure> in bursts; recompute the
+        # scrollregion once per burst instead of walking bbox("all") for every event.
+        self._scrollregion_job = None
+        self.viewPort.bind("<Configure>", self._schedule_scrollregion)
+
+    def _schedule_scrollregion(self, _=None):
+        if self._scrollregion_job is not None:
+            self.canvas.after_cancel(self._scrollregion_job)
+        self._scrollregion_job = self.canvas.after(50, self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scrollregion_job = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
 
 class CellEditor:
@@ -264,89 +699,99 @@ class CellEditor:
     Combobox commits on selection/Enter/Tab (no focus-out commit).
     Entry commits on Enter/Tab/FocusOut. Escape always cancels.
 
-    Takes focus + grab on open; releases on destroy so the UI never gets stuck.
+    Takes focus on open (no grab), so the UI never gets stuck.
+    The app keeps one editor per kind (Entry / Combobox) and re-shows it with
+    open(); destroy() only hides it, so no Tk widgets are built per click.
     """
-    def __init__(self, app, tree, item, col_name, bbox, options, current_val, on_commit):
+    def __init__(self, app, tree, is_combo: bool):
         self.app = app
         self.tree = tree
-        self.item = item
-        self.col_name = col_name
-        self.on_commit = on_commit
-
-        x, y, w, h = bbox
-        abs_x = tree.winfo_rootx() + x
-        abs_y = tree.winfo_rooty() + y
+        self.is_combo = is_combo
+        self.item = None
+        self.col_name = None
+        self.on_commit = None
+        self._active = False
 
         self.top = tk.Toplevel(tree)
         self.top.withdraw()
         self.top.overrideredirect(True)
-
         try:
             self.top.transient(tree.winfo_toplevel())
-            self.top.lift()
-            self.top.attributes("-topmost", True)
         except Exception:
             pass
 
-        self.top.geometry(f"{w}x{h}+{abs_x}+{abs_y}")
-        self.top.deiconify()
+        if self.is_combo:
+            self.widget = ttk.Combobox(self.top, state="readonly", style="Modern.TCombobox")
+        else:
+            self.widget = ttk.Entry(self.top, style="Modern.TEntry")
+        self.widget.pack(fill="both", expand=True)
+
+        # Bindings
+        self.widget.bind("<Return>", self._commit)
+        self.widget.bind("<Tab>", self._commit)
+        self.widget.bind("<Escape>", self._cancel)
 
-        self.is_combo = options is not None
         if self.is_combo:
-            self.widget = ttk.Combobox(self.top, values=options, state="readonly", style="Modern.TCombobox")
+            self.widget.bind("<<ComboboxSelected>>", self._commit)
+        else:
+            self.widget.bind("<FocusOut>", self._commit)
+
+    def open(self, item, col_name, bbox, options, current_val, on_commit):
+        """Show the editor over the cell at bbox, loaded with current_val."""
+        self.item = item
+        self.col_name = col_name
+        self.on_commit = on_commit
+
+        x, y, w, h = bbox
+        abs_x = self.tree.winfo_rootx() + x
+        abs_y = self.tree.winfo_rooty() + y
+
+        if self.is_combo:
+            self.widget.configure(values=options)
             self.widget.set(current_val if current_val is not None else "")
         else:
-            self.widget = ttk.Entry(self.top, style="Modern.TEntry")
+            self.widget.delete(0, "end")
             if current_val is not None:
                 self.widget.insert(0, str(current_val))
 
-        self.widget.pack(fill="both", expand=True)
+        self.top.geometry(f"{w}x{h}+{abs_x}+{abs_y}")
+        self.top.deiconify()
+        self._active = True
 
-        # focus + grab (but allow scrolling)
         try:
-            self.top.focus_force()
-        except Exception:
-            pass
-        try:
-            self.widget.focus_force()
+            self.top.lift()
         except Exception:
             pass
 
-        # Don't use grab_set() as it prevents scrolling
-        # Instead, use a more gentle approach
+        # Focus only: no grab_set() (it blocks scrolling) and no -topmost toggle,
+        # transient + lift already keep the editor above the grid
         try:
-            self.top.after(100, lambda: self.top.attributes("-topmost", False))
+            self.widget.focus_force()
         except Exception:
             pass
 
-        # Bindings
-        self.widget.bind("<Return>", self._commit)
-        self.widget.bind("<Tab>", self._commit)
-        self.widget.bind("<Escape>", self._cancel)
-
         if self.is_combo:
-            self.widget.bind("<<ComboboxSelected>>", self._commit)
-            self.widget.after(10, lambda: self.widget.event_generate("<Alt-Down>"))
-        else:
-            self.widget.bind("<FocusOut>", self._commit)
-
-        # Ensure app pointer is cleared if the window goes away
-        self.top.bind("<Destroy>", lambda e: setattr(self.app, "_editor", None))
+            self.widget.after(10, lambda: self._active and self.widget.event_generate("<Alt-Down>"))
 
     def _commit(self, _=None):
+        if not self._active:
+            return
         try:
             value = self.widget.get().strip()
         except Exception:
             value = ""
+        on_commit = self.on_commit
         self.destroy()
-        self.on_commit(value)
+        on_commit(value)
 
     def _cancel(self, _=None):
         self.destroy()
 
     def destroy(self):
+        """Hide the editor; the widgets stay alive for the next open()."""
+        self._active = False
         try:
-            self.top.destroy()
+            self.top.withdraw()
         except Exception:
             pass
         self.app._editor = None
@@ -380,6 +825,10 @@ class App(tk.Tk):
         self._is_loading = False
         self._operation_in_progress = False
 
+        # Access I/O runs here, one job at a time, so the Tk thread never blocks on ODBC
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="access-io")
+        self._io_status: str | None = None  # progress text posted by the worker
+
         # --- Modern Toolbar
         toolbar = ttk.Frame(self, style="Modern.TFrame")
         toolbar.pack(fill="x", padx=16, pady=12)
@@ -406,7 +855,7 @@ class App(tk.Tk):
         
         ttk.Label(table_section, text="Table:", style="Modern.TLabel").pack(side="left")
         ttk.Entry(table_section, textvariable=self.table_var, width=20, style="Modern.TEntry").pack(side="left", padx=(8, 4))
-        self.btn_reload = ttk.Button(table_section, text="Reload", command=self.reload_all, style="Success.TButton")
+        self.btn_reload = ttk.Button(table_section, text="Reload", command=lambda: self.reload_all(force=True), style="Success.TButton")
         self.btn_reload.pack(side="left")
 
         # --- Modern Notebook with subtle border
@@ -429,10 +878,21 @@ class App(tk.Tk):
 
         self.tree = ttk.Treeview(tree_wrap, show="headings", selectmode="none")
         self._editor: CellEditor | None = None   # active cell editor (if any)
+        self._editors: dict[bool, CellEditor] = {}  # pooled editors keyed by is_combo
+        self._debounced_close = None              # pending after() id from _schedule_close
         self.columns_present: list[str] = []
         self._checked = set()
         self._pending_edits: dict[str, dict] = {}
 
+        # Virtualized grid: every row lives here, the Treeview only holds the visible window
+        self._rows: list[list] = []          # display-order cell values (without "Select")
+        self._row_iids: list[str] = []
+        self._row_tags: list[tuple] = []
+        self._iid_pos: dict[str, int] = {}   # iid -> index into _rows
+        self._col_pos: dict[str, int] = {}   # column -> index into a _rows entry
+        self._view_top = 0                   # first row index shown
+        self._window = (0, 0)                # [start, end) rows currently in the Treeview
+
         # Modern Styling
         style = ttk.Style(self)
         try:
@@ -458,144 +918,59 @@ class App(tk.Tk):
         }
 
         # Configure main window background
-        self.configure(bg=self.colors['background'])
-
-        # Modern Treeview styling
-        style.configure(
-            "Modern.Treeview",
-            background=self.colors['surface'],
-            foreground=self.colors['text_primary'],
-            borderwidth=0,
-            rowheight=32,
-            font=('Segoe UI', 9),
-            fieldbackground=self.colors['surface']
-        )
-        
-        # Treeview selection styling
-        style.map(
-            "Modern.Treeview",
-            background=[("selected", self.colors['primary'])],
-            foreground=[("selected", self.colors['surface'])],
-        )
-
-        # Modern Treeview heading
-        style.configure(
-            "Modern.Treeview.Heading",
-            background=self.colors['surface_alt'],
-            foreground=self.colors['text_primary'],
-            borderwidth=0,
-            relief="flat",
-            font=('Segoe UI', 9, 'bold'),
-            padding=(12, 8)
-        )
-        style.map(
-            "Modern.Treeview.Heading",
-            background=[("active", self.colors['border'])],
-        )
-
-        # Modern button styles
-        style.configure(
-            "Modern.TButton",
-            background=self.colors['primary'],
-            foreground=self.colors['surface'],
-            borderwidth=0,
-            focuscolor="none",
-            font=('Segoe UI', 9, 'bold'),
-            padding=(16, 8)
-        )
-        style.map(
-            "Modern.TButton",
-            background=[("active", self.colors['primary_hover']), ("pressed", self.colors['primary_hover'])],
-        )
-
-        # Success button
-        style.configure(
-            "Success.TButton",
-            background=self.colors['success'],
-            foreground=self.colors['surface'],
-            borderwidth=0,
-            focuscolor="none",
-            font=('Segoe UI', 9, 'bold'),
-            padding=(16, 8)
-        )
-        style.map(
-            "Success.TButton",
-            background=[("active", "#059669"), ("pressed", "#059669")],
-        )
-
-        # Disabled button style
-        style.configure(
-            "Disabled.TButton",
-            background=self.colors['text_muted'],
-            foreground=self.colors['surface'],
-            borderwidth=0,
-            focuscolor="none",
-            font=('Segoe UI', 9, 'bold'),
-            padding=(16, 8)
-        )
-
-        # Modern entry and combobox
-        style.configure(
-            "Modern.TEntry",
-            fieldbackground=self.colors['surface'],
-            borderwidth=1,
-            relief="solid",
-            bordercolor=self.colors['border'],
-            font=('Segoe UI', 9),
-            padding=(8, 6)
-        )
-        style.map(
-            "Modern.TEntry",
-            bordercolor=[("focus", self.colors['primary'])],
-        )
-
-        style.configure(
-            "Modern.TCombobox",
-            fieldbackground=self.colors['surface'],
-            borderwidth=1,
-            relief="solid",
-            bordercolor=self.colors['border'],
-            font=('Segoe UI', 9),
-            padding=(8, 6)
-        )
-        style.map(
-            "Modern.TCombobox",
-            bordercolor=[("focus", self.colors['primary'])],
-        )
-
-        # Modern checkbutton
-        style.configure(
-            "Modern.TCheckbutton",
-            background=self.colors['surface'],
-            foreground=self.colors['text_primary'],
-            font=('Segoe UI', 9),
-            padding=0
-        )
-
-        # Modern label
-        style.configure(
-            "Modern.TLabel",
-            background=self.colors['background'],
-            foreground=self.colors['text_primary'],
-            font=('Segoe UI', 9)
-        )
-
-        # Modern frame
-        style.configure(
-            "Modern.TFrame",
-            background=self.colors['background'],
-            borderwidth=0
-        )
+        c = self.colors
+        primary, surface, surface_alt = c['primary'], c['surface'], c['surface_alt']
+        border, text_primary, background = c['border'], c['text_primary'], c['background']
+        self.configure(bg=background)
+
+        body_font = ('Segoe UI', 9)
+        bold_font = ('Segoe UI', 9, 'bold')
+        button = dict(foreground=surface, borderwidth=0, focuscolor="none", font=bold_font, padding=(16, 8))
+        field = dict(fieldbackground=surface, borderwidth=1, relief="solid", bordercolor=border,
+                     font=body_font, padding=(8, 6))
+
+        styles = {
+            # Modern Treeview + heading
+            "Modern.Treeview": dict(background=surface, foreground=text_primary, borderwidth=0,
+                                    rowheight=TREE_ROW_HEIGHT, font=body_font, fieldbackground=surface),
+            "Modern.Treeview.Heading": dict(background=surface_alt, foreground=text_primary, borderwidth=0,
+                                            relief="flat", font=bold_font, padding=(12, 8)),
+            # Buttons: primary, success, disabled
+            "Modern.TButton": dict(button, background=primary),
+            "Success.TButton": dict(button, background=c['success']),
+            "Disabled.TButton": dict(button, background=c['text_muted']),
+            # Modern entry and combobox
+            "Modern.TEntry": field,
+            "Modern.TCombobox": field,
+            # Checkbutton, label, frame
+            "Modern.TCheckbutton": dict(background=surface, foreground=text_primary, font=body_font, padding=0),
+            "Modern.TLabel": dict(background=background, foreground=text_primary, font=body_font),
+            "Modern.TFrame": dict(background=background, borderwidth=0),
+        }
+        style_maps = {
+            "Modern.Treeview": dict(background=[("selected", primary)], foreground=[("selected", surface)]),
+            "Modern.Treeview.Heading": dict(background=[("active", border)]),
+            "Modern.TButton": dict(background=[("active", c['primary_hover']), ("pressed", c['primary_hover'])]),
+            "Success.TButton": dict(background=[("active", "#059669"), ("pressed", "#059669")]),
+            "Modern.TEntry": dict(bordercolor=[("focus", primary)]),
+            "Modern.TCombobox": dict(bordercolor=[("focus", primary)]),
+        }
+        for name, kw in styles.items():
+            style.configure(name, **kw)
+        for name, kw in style_maps.items():
+            style.map(name, **kw)
 
         # Apply modern styles
         self.tree.configure(style="Modern.Treeview")
 
-        # Scrollbars: close editor whenever you scroll via bars
+        # Scrollbars: close editor whenever you scroll via bars.
+        # The vertical bar drives the row window, not the Treeview's own yview.
         ys = ttk.Scrollbar(tree_wrap, orient="vertical")
         xs = ttk.Scrollbar(tree_wrap, orient="horizontal")
-        ys.configure(command=lambda *a: (self._close_editor(False), self.tree.yview(*a)))
+        ys.configure(command=lambda *a: (self._close_editor(False), self._virtual_yview(*a)))
         xs.configure(command=lambda *a: (self._close_editor(False), self.tree.xview(*a)))
-        self.tree.configure(yscrollcommand=ys.set, xscrollcommand=xs.set)
+        self.tree.configure(xscrollcommand=xs.set)
+        self._ys = ys
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         ys.grid(row=0, column=1, sticky="ns")
@@ -607,7 +982,8 @@ class App(tk.Tk):
         self.nb.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         self.tree.bind("<Unmap>",                lambda e: self._close_editor(False)) # hiding tree
         self.bind("<Unmap>",                     lambda e: self._close_editor(False)) # app minimized/unmapped
-        self.tree.bind("<Configure>",            lambda e: self._close_editor(False), add="+")
+        self.tree.bind("<Configure>",            self._schedule_close, add="+")         # resize bursts => one close
+        self.tree.bind("<Configure>",            lambda e: self._render_window(), add="+")  # resize => refill window
         # Wheel scrolling (vertical; hold Shift for horizontal)
         self.tree.bind("<MouseWheel>",           self.on_mousewheel)   # Windows/macOS
         self.tree.bind("<Shift-MouseWheel>",     self.on_mousewheel)
@@ -652,8 +1028,15 @@ class App(tk.Tk):
 
         self.scroll = XYScrollFrame(self.tab_add)
         self.scroll.pack(fill="both", expand=True, padx=16, pady=8)
-        self.scroll.vsb.configure(command=self.scroll.canvas.yview)
+        # Rows are virtualized (see _render_add_window): the vertical scrollbar moves
+        # the row window, the canvas itself only scrolls sideways
+        self.scroll.canvas.configure(yscrollcommand="")
+        self.scroll.vsb.configure(command=self._add_yview)
         self.scroll.hsb.configure(command=self.scroll.canvas.xview)
+        self.scroll.canvas.bind("<Configure>", lambda e: self._render_add_window(), add="+")
+        for seq in ("<MouseWheel>", "<Shift-MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class("AddRows", seq, self.on_add_mousewheel)
+            self.scroll.canvas.bind(seq, self.on_add_mousewheel)
 
         # Modern status bar
         status_frame = ttk.Frame(self, style="Modern.TFrame")
@@ -675,7 +1058,19 @@ class App(tk.Tk):
         # Data caches
         self.df_current: pd.DataFrame | None = None
         self.dropdown_options: dict[str, list] = {}
-        self.new_widgets: list[dict] = []
+        self._combo_values: dict[str, tuple] = {}  # dropdown_options pre-stringified, shared by every Combobox
+        self.new_row_state: list[dict] = []      # per staged record: selected / entries / dropdowns / comp
+        self._add_state: dict[tuple, dict] = {}  # same states keyed by (GasIDREC, PressuresIDREC)
+        self._add_row_pool: list[dict] = []      # Add New row widgets, recycled as the window scrolls
+        self._add_top = 0                        # index into new_ids of the first row shown
+        self._add_vcmd = None                    # shared validatecommand for every Add New Entry
+        self._add_entry_of: dict[str, tuple] = {}  # Entry path -> (pooled row, column)
+        self._comp_pending: dict[int, tuple] = {}  # id(state) -> (state, row) awaiting a composite recompute
+        self._add_wheel_units = 0                # wheel units not yet applied to the Add New window
+        self._add_table = None                   # Add New grid frame (header + pooled rows)
+        self._add_empty = None                   # Add New empty-state frame
+        self._add_rebuild_job = None             # pending after() id from _schedule_add_rebuild
+        self._add_dirty = False                  # Add New widgets are behind new_ids (tab not shown)
 
         self.new_ids: list[dict] = []
         self._staged_pairs: set[tuple] = set()  # (GasIDREC, PressuresIDREC)
@@ -684,11 +1079,48 @@ class App(tk.Tk):
         # Initial load
         self.reload_all()
 
+    def destroy(self):
+        """Close the shared Access connection along with the window."""
+        self._io_executor.submit(close_conn)  # after any job still running
+        self._io_executor.shutdown(wait=False)
+        super().destroy()
+
+    # ---------------- Background Access I/O ----------------
+
+    def _run_io(self, fn, *args, on_done):
+        """
+        Run fn(*args) on the Access worker thread and hand the finished Future
+        to on_done on the Tk thread. Tk isn't thread-safe, so the worker never
+        touches widgets; the Tk side polls with after() instead.
+        """
+        self._io_status = None
+        fut = self._io_executor.submit(fn, *args)
+        self.after(IO_POLL_MS, self._poll_io, fut, on_done)
+
+    def _poll_io(self, fut, on_done):
+        status, self._io_status = self._io_status, None
+        if status:
+            self.count_label.config(text=status)
+        if fut.done():
+            on_done(fut)
+        else:
+            self.after(IO_POLL_MS, self._poll_io, fut, on_done)
+
+    def _report_io(self, text: str):
+        """Progress hook for worker jobs; picked up by _poll_io."""
+        self._io_status = text
+
     # ---------------- Button state management ----------------
 
     def _set_loading_state(self, loading: bool):
-        """Enable/disable buttons during operations."""
+        """
+        Enable/disable buttons during operations. The grid stays live while an
+        Access job runs, so cell editing and check toggles are refused until
+        it finishes (see _start_cell_edit / _toggle_item_checkbox).
+        """
         self._is_loading = loading
+        if loading:
+            self._close_editor(False)
         state = "disabled" if loading else "normal"
         
         self.btn_reload.config(state=state)
@@ -706,7 +1138,7 @@ class App(tk.Tk):
             for iid, edits in self._pending_edits.items()
         )
         has_staged = len(self.new_ids) > 0
-        has_selected_staged = any(w["selected"].get() for w in self.new_widgets)
+        has_selected_staged = any(st["selected"] for st in self.new_row_state)
 
         # Export: enabled if we have data
         self.btn_export.config(state="normal" if has_data and not self._is_loading else "disabled")
@@ -733,12 +1165,26 @@ class App(tk.Tk):
             self.after(100, self.reload_all)
 
     def on_tab_changed(self, event=None):
-        """Handle tab changes - close editor and update button states."""
+        """Handle tab changes - close editor, build Add New if it went stale, update button states."""
         self._close_editor(False)
+        if self._add_dirty and self.nb.select() == str(self.tab_add):
+            self._schedule_add_rebuild()
         self._update_button_states()
 
     # ---------------- Editor lifecycle ----------------
 
+    def _schedule_close(self, _=None):
+        """Close the editor once a burst of <Configure> events settles (50 ms)."""
+        if self._editor is None:
+            return
+        if self._debounced_close:
+            self.after_cancel(self._debounced_close)
+        self._debounced_close = self.after(50, self._run_scheduled_close)
+
+    def _run_scheduled_close(self):
+        self._debounced_close = None
+        self._close_editor(False)
+
     def _close_editor(self, commit: bool = False):
         """
         Close the active cell editor (if any).
@@ -759,19 +1205,27 @@ class App(tk.Tk):
 
     # ---------------- Data/UI load ----------------
 
-    def reload_all(self):
+    def _db_path(self) -> str:
+        """Database path as every Access call should see it (cache and connection keys)."""
+        return self.db_path_var.get().strip()
+
+    def _table_name(self) -> str:
+        return self.table_var.get().strip()
+
+    def reload_all(self, force: bool = False):
         """
         Pull from Access, rebuild Current Wells grid with:
         - completed rows first
         - pending rows (blank Well Name) at the bottom, highlighted.
         Rebuild Add New using ONLY self.new_ids (staged by the user).
+        force=True (the Reload button) always re-reads the table from disk.
         """
         if self._is_loading:
             return
 
         # Validate inputs
-        db_path = self.db_path_var.get().strip()
-        table_name = self.table_var.get().strip()
+        db_path = self._db_path()
+        table_name = self._table_name()
         
         if not db_path:
             messagebox.showerror("Invalid Input", "Please specify a database path.")
@@ -782,10 +1236,14 @@ class App(tk.Tk):
 
         self._set_loading_state(True)
         self.count_label.config(text="Loading data...")
-        self.update()
+        self.update_idletasks()  # paint the status only; no event processing mid-load
+
+        self._run_io(load_access_table, db_path, table_name, force, on_done=self._apply_reload)
 
+    def _apply_reload(self, fut):
+        """Tk-thread half of reload_all: rebuild both tabs from the loaded table."""
         try:
-            self.df_current = load_access_table(db_path, table_name)
+            self.df_current = fut.result()
         except FileNotFoundError as e:
             messagebox.showerror("File Not Found", f"Database file not found:\n{e}")
             self._set_loading_state(False)
@@ -804,54 +1262,19 @@ class App(tk.Tk):
 
         # Columns present in DB (keep order)
         cols_present = [c for c in TABLE_COLUMNS if c in self.df_current.columns]
+        columns_changed = ["Select"] + cols_present != self.columns_present
         self.columns_present = ["Select"] + cols_present
-        self.tree.configure(columns=self.columns_present)
-
-        # Calmer, consistent widths; stretch long text columns
-        col_widths = {
-            "Select": 64,
-            "ID": 40,
-            "GasIDREC": 260,
-            "PressuresIDREC": 260,
-            "Well Name": 220,
-            "Formation Producer": 160,
-            "Layer Producer": 160,
-            "Fault Block": 140,
-            "Pad Name": 160,
-            "Completions Technology": 180,
-            "Lateral Length": 120,
-            "Value Navigator UWI": 200,
-            "Composite name": 260,
-        }
-        min_widths = {
-            "Select": 32,
-            "ID": 56,
-            "GasIDREC": 220,
-            "PressuresIDREC": 220,
-            "Well Name": 160,
-            "Formation Producer": 140,
-            "Layer Producer": 140,
-            "Fault Block": 120,
-            "Pad Name": 140,
-            "Completions Technology": 160,
-            "Lateral Length": 96,
-            "Value Navigator UWI": 160,
-            "Composite name": 200,
-        }
-        stretch_cols = {"Well Name", "Pad Name", "Value Navigator UWI", "Composite name"}
-
-        for c in self.columns_present:
-            self.tree.heading(c, text=c, anchor="w" if c != "Select" else "center")
-            self.tree.column(
-                c,
-                width=col_widths.get(c, 160),
-                minwidth=min_widths.get(c, 100),
-                anchor="w" if c != "Select" else "center",
-                stretch=(c in stretch_cols),
-            )
+        # Same columns as last load (the usual case) skips this, keeping any widths the user dragged
+        if columns_changed:
+            # First load or a different table layout: set up columns, headings and widths
+            self.tree.configure(columns=self.columns_present)
+            for c in self.columns_present:
+                spec = COLUMN_SPEC.get(c, DEFAULT_COLUMN_SPEC)
+                self.tree.heading(c, text=c, anchor=spec.anchor)
+                self.tree.column(c, width=spec.width, minwidth=spec.minwidth, anchor=spec.anchor, stretch=spec.stretch)
+        self.tree.configure(displaycolumns=())  # no per-column layout until the rows are in
 
         # Reset UI + tags
-        self.tree.delete(*self.tree.get_children())
         self._checked.clear()
         self._pending_edits.clear()
         self._close_editor(False)
@@ -873,55 +1296,81 @@ class App(tk.Tk):
 
         df = self.df_current.copy()
 
-        def is_blank(val):
-            return pd.isna(val) or str(val).strip() == ""
+        def is_blank(col) -> np.ndarray:
+            # NULL or whitespace-only, one vectorised pass per column (string kernel, no per-cell Python)
+            s = df[col]
+            return (s.isna() | s.astype(TEXT_DTYPE).str.strip().eq("").fillna(True)).to_numpy(dtype=bool)
+
+        blank = {c: is_blank(c) for c in required_fields + other_fields}
+        # Required fields present, and all the other fields blank
+        has_required = ~np.logical_or.reduce([blank[c] for c in required_fields])
+        others_blank = np.logical_and.reduce([blank[c] for c in other_fields])
 
-        # Check required fields present
-        has_required = df[required_fields].apply(lambda r: all(not is_blank(r[c]) for c in required_fields), axis=1)
-        # Check other fields are all blank
-        others_blank = df[other_fields].apply(lambda r: all(is_blank(r[c]) for c in other_fields), axis=1)
+        mask = has_required & others_blank
 
-        mask_pending = has_required & others_blank
+        # Categorical/string columns hold <NA> for blanks; show them as empty cells
+        for col in DROPDOWN_FIELDS + TEXT_FIELDS:
+            if col in df.columns:
+                df[col] = df[col].astype(object).fillna("")
 
-        df_pending = df.loc[mask_pending]
-        df_complete = df.loc[~mask_pending]
+        # Display order: COMPLETE rows first, then PENDING rows (at bottom), highlighted
+        order = np.concatenate([np.flatnonzero(~mask), np.flatnonzero(mask)])
+        pend = mask[order]
 
-        # Track which Treeview items are pending so we can move them when checked
-        self._pending_row_ids = set()
-        self._pending_iid_to_pair = {}
+        # Cell values for every row in one (N, K) object array
+        values_mat = df[cols_present].to_numpy(dtype=object, na_value="")[order]
+
+        # iid = Access ID; rows without one fall back to the index label ("p_<idx>" if pending)
+        labels = df.index.astype(str).to_numpy(dtype=object)
+        fallback = np.where(mask, "p_" + labels, labels)
+        if "ID" in df.columns:
+            iids = np.where(df["ID"].isna().to_numpy(), fallback, df["ID"].astype(str).to_numpy(dtype=object))
+        else:
+            iids = fallback
+        iids = iids[order]
 
         # Stable zebra striping independent of DataFrame index
-        rowno = 0
-
-        # Insert COMPLETE rows first
-        for idx, row in df_complete.iterrows():
-            iid = str(row["ID"]) if "ID" in row and pd.notna(row["ID"]) else str(idx)
-            values = ["☐"] + [row.get(c, "") for c in cols_present]
-            tag = "odd" if (rowno % 2) else "even"
-            self.tree.insert("", "end", iid=iid, values=values, tags=(tag,))
-            rowno += 1
-
-        # Then insert PENDING rows (at bottom), highlighted
-        for idx, row in df_pending.iterrows():
-            iid = str(row["ID"]) if "ID" in row and pd.notna(row["ID"]) else f"p_{idx}"
-            values = ["☐"] + [row.get(c, "") for c in cols_present]
-            tag = ("odd" if (rowno % 2) else "even", "pending")
-            self.tree.insert("", "end", iid=iid, values=values, tags=tag)
-            self._pending_row_ids.add(iid)
-            self._pending_iid_to_pair[iid] = (
-                str(row.get("GasIDREC") or ""),
-                str(row.get("PressuresIDREC") or "")
+        zebra = np.where(np.arange(len(order)) & 1, "odd", "even")
+
+        # Backing rows for the virtualized grid
+        rows = values_mat.tolist()
+        row_iids = iids.tolist()
+        row_tags = [(z, "pending") if p else (z,) for z, p in zip(zebra.tolist(), pend.tolist())]
+
+        gas_i = cols_present.index("GasIDREC") if "GasIDREC" in cols_present else None
+        pres_i = cols_present.index("PressuresIDREC") if "PressuresIDREC" in cols_present else None
+        # Track which items are pending so we can move them when checked.
+        # Pending rows are the tail of the display order: visit only those
+        first_pending = len(rows) - int(mask.sum())
+        self._pending_iid_to_pair = {
+            iid: (
+                str((vals[gas_i] if gas_i is not None else "") or ""),
+                str((vals[pres_i] if pres_i is not None else "") or ""),
             )
-            rowno += 1
+            for vals, iid in zip(rows[first_pending:], row_iids[first_pending:])
+        }
+        self._pending_row_ids = set(self._pending_iid_to_pair)
+
+        self._rows, self._row_iids, self._row_tags = rows, row_iids, row_tags
+        self._iid_pos = {iid: i for i, iid in enumerate(row_iids)}
+        self._col_pos = {c: i for i, c in enumerate(cols_present)}
 
-        # Dropdown choices from ALL data
-        self.dropdown_options = get_unique_options(self.df_current)
+        # Materialize only the first screenful; scrolling fills in the rest
+        self.tree.delete(*self.tree.get_children())
+        self._window = (0, 0)
+        self._virtual_yview("moveto", 0.0)
+        self.tree.configure(displaycolumns=self.columns_present)
+
+        # Dropdown choices from ALL data (computed once per load of the file)
+        options = get_unique_options(self.df_current, self.df_current.attrs.get("source"))
+        if options != self.dropdown_options:
+            self._set_dropdown_options(options)
 
         # Build Add New tab ONLY from staged rows (self.new_ids)
-        self.build_add_rows()
+        self._schedule_add_rebuild()
 
         # Footer counts
-        pending_ct = len(df_pending)
+        pending_ct = int(mask.sum())
         staged_ct  = len(self.new_ids)
         self.count_label.config(
             text=f"✓ Loaded {len(self.df_current)} rows • {pending_ct} pending (bottom) • {staged_ct} staged for Add New"
@@ -930,33 +1379,255 @@ class App(tk.Tk):
         self._set_loading_state(False)
         self._update_button_states()
 
+    def _set_dropdown_options(self, options: dict[str, list]):
+        """Store dropdown choices and their shared, pre-stringified Combobox tuples."""
+        self.dropdown_options = options
+        self._combo_values = {col: tuple(map(str, opts)) for col, opts in options.items()}
+
+    # ---------------- Virtualized Current Wells grid ----------------
+
+    def _visible_rows(self) -> int:
+        """Rows that fit below the heading at the tree's current height."""
+        return max(1, self.tree.winfo_height() // TREE_ROW_HEIGHT - 1)
+
+    def _virtual_yview(self, *args):
+        """
+        yview over ALL rows, scrollbar protocol: ("moveto", fraction) or
+        ("scroll", n, "units"|"pages"). Moves the window and re-renders it.
+        """
+        total = len(self._rows)
+        fit = self._visible_rows()
+        top = self._view_top
+        if args and args[0] == "moveto":
+            top = int(round(float(args[1]) * total))
+        elif args and args[0] == "scroll":
+            top += int(args[1]) * (fit if args[2] == "pages" else 1)
+        self._view_top = max(0, min(top, total - fit))
+        self._render_window()
+
+    def _render_window(self):
+        """
+        Sync the Treeview to rows [top, top + fit]: delete rows that left the
+        window and insert the ones entering it, then update the scrollbar.
+        """
+        tree = self.tree
+        total = len(self._rows)
+        fit = self._visible_rows()
+        top = self._view_top = max(0, min(self._view_top, total - fit))
+        start, end = top, min(total, top + fit + 1)  # +1 covers a partly visible last row
+        old_start, old_end = self._window
+
+        if start >= old_end or end <= old_start:
+            tree.delete(*tree.get_children())
+            for i in range(start, end):
+                self._insert_row(i, "end")
+        else:
+            leaving = self._row_iids[old_start:start] + self._row_iids[end:old_end]
+            if leaving:
+                tree.delete(*leaving)
+            for i in range(start, old_start):
+                self._insert_row(i, i - start)
+            for i in range(max(old_end, start), end):
+                self._insert_row(i, "end")
+        self._window = (start, end)
+        tree.yview_moveto(0)
+
+        if total:
+            self._ys.set(top / total, min(1.0, (top + fit) / total))
+        else:
+            self._ys.set(0.0, 1.0)
+
+    def _insert_row(self, i: int, index):
+        # Straight to the Tcl command: skips Treeview.insert's option-dict processing
+        iid = self._row_iids[i]
+        values = ("☑" if iid in self._checked else "☐", *self._rows[i])
+        self.tk.call(self.tree._w, "insert", "", index, "-id", iid, "-values", values, "-tags", self._row_tags[i])
+
+    def _remove_row(self, iid: str):
+        """Drop a row from the grid (and from the window if it is shown)."""
+        pos = self._iid_pos[iid]
+        del self._rows[pos], self._row_iids[pos], self._row_tags[pos]
+        self._iid_pos = {r: i for i, r in enumerate(self._row_iids)}
+        self.tree.delete(*self.tree.get_children())
+        self._window = (0, 0)
+        self._render_window()
+
+    def _get_cell(self, iid: str, col: str):
+        """Current value of a cell, whether or not its row is in the window."""
+        if col == "Select":
+            return "☑" if iid in self._checked else "☐"
+        return self._rows[self._iid_pos[iid]][self._col_pos[col]]
+
+    def _set_cell(self, iid: str, col: str, value):
+        self._rows[self._iid_pos[iid]][self._col_pos[col]] = value
+        if self.tree.exists(iid):
+            self.tree.set(iid, col, value)
+
     # ---------------- Add New tab ----------------
 
     def build_add_rows(self):
         """
-        Build the grid of inputs for rows that have IDs but blank Well Name.
+        Show one input row per staged record (self.new_ids).
+        What the user typed lives in self.new_row_state (parallel to new_ids);
+        only the rows in view get widgets, taken from self._add_row_pool.
         """
-        # Clear previous UI
-        for child in list(self.scroll.viewPort.children.values()):
-            child.destroy()
-        self.new_widgets.clear()
-
+        self._sync_add_state()
         if not self.new_ids:
             # Show empty state
-            empty_frame = ttk.Frame(self.scroll.viewPort, style="Modern.TFrame")
-            empty_frame.pack(fill="both", expand=True, pady=50)
+            if self._add_table is not None:
+                self._add_table.pack_forget()
+            self._add_empty_frame().pack(fill="both", expand=True, pady=50)
+            self._update_button_states()
+            return
+
+        if self._add_empty is not None:
+            self._add_empty.pack_forget()
+        table = self._add_table_frame()
+        if not table.winfo_manager():
+            table.pack(fill="both", expand=True, padx=16, pady=8)
+        self._render_add_window()
+        self._update_button_states()
+
+    def _sync_add_state(self):
+        """Realign self.new_row_state with self.new_ids after new_ids was replaced."""
+        # Carry typed values over for records that are still staged
+        states = {}
+        for rec in self.new_ids:
+            pair = (str(rec.get("GasIDREC") or ""), str(rec.get("PressuresIDREC") or ""))
+            states[pair] = self._add_state.get(pair) or self._new_add_state(rec)
+        self._add_state = states
+        self.new_row_state = list(states.values())
+
+    def _new_add_state(self, rec: dict) -> dict:
+        """Initial input state for a freshly staged record."""
+        entries = {col: str(rec.get(col) or "") for col in ENTRY_FIELDS}
+        return {
+            "selected": True,
+            # Prefill from staged record if present (Well Name will now come through)
+            "entries": entries,
+            "dropdowns": dict.fromkeys(DROPDOWN_FIELDS, ""),
+            "comp": "",
+        }
+
+    def _add_row_for(self, rec: dict):
+        """Add one freshly staged record to the Add New grid (O(1) vs build_add_rows)."""
+        if (self._add_rebuild_job is not None
+                or self._add_table is None or not self._add_table.winfo_manager()):
+            self._schedule_add_rebuild()
+            return
+        state = self._new_add_state(rec)
+        self._add_state[(str(rec.get("GasIDREC") or ""), str(rec.get("PressuresIDREC") or ""))] = state
+        self.new_row_state.append(state)
+        self._render_add_window()
+        self._update_button_states()
+
+    def _schedule_add_rebuild(self):
+        """Coalesce bursts of rebuild requests into one build_add_rows (30 ms later)."""
+        if self._add_rebuild_job is None:
+            self._add_rebuild_job = self.after(30, self._flush_add_rebuild)
+
+    def _flush_add_rebuild(self):
+        self._add_rebuild_job = None
+        if self.nb.select() != str(self.tab_add):
+            # Not on screen: keep the staged state current (Update Selected reads it)
+            # and leave the widgets until the tab is opened
+            self._sync_add_state()
+            self._add_dirty = True
+            self._update_button_states()
+            return
+        self._add_dirty = False
+        self.build_add_rows()
+
+    def _add_visible_rows(self) -> int:
+        """Add New rows that fit below the header at the canvas' current height."""
+        table = self._add_table
+        header_h = table.grid_bbox(0, 0)[3]
+        row_h = table.grid_bbox(0, 1)[3] if self._add_row_pool else 0
+        if row_h <= 1:
+            row_h = ADD_ROW_HEIGHT  # not laid out yet
+        return max(1, (self.scroll.canvas.winfo_height() - header_h) // row_h)
+
+    def _add_yview(self, *args):
+        """Scrollbar protocol for the Add New rows; moves the window over self.new_ids."""
+        if self._add_table is None or not self._add_table.winfo_manager():
+            return
+        total = len(self.new_ids)
+        fit = self._add_visible_rows()
+        top = self._add_top
+        if args and args[0] == "moveto":
+            top = int(round(float(args[1]) * total))
+        elif args and args[0] == "scroll":
+            top += int(args[1]) * (fit if args[2] == "pages" else 1)
+        self._add_top = top
+        self._render_add_window()
+
+    def _render_add_window(self):
+        """
+        Point the pooled rows at new_ids[top:top + fit + 1] and park the rest.
+        Rows keep their grid position; only their contents are swapped.
+        """
+        if self._add_table is None or not self._add_table.winfo_manager():
+            return
+        total = len(self.new_ids)
+        fit = self._add_visible_rows()
+        top = self._add_top = max(0, min(self._add_top, total - fit))
+        shown = min(fit + 1, total - top)  # +1 covers a partly visible last row
+
+        for k in range(shown):
+            self._show_add_row(k, top + k)
+        for row in self._add_row_pool[shown:]:
+            if row["index"] is not None:
+                row["index"] = row["rec"] = row["state"] = None
+                for box in row["cells"]:
+                    box.grid_remove()
+
+        if total:
+            self.scroll.vsb.set(top / total, min(1.0, (top + fit) / total))
+        else:
+            self.scroll.vsb.set(0.0, 1.0)
+
+    def on_add_mousewheel(self, event):
+        """Wheel scrolling over the Add New rows (vertical; hold Shift for horizontal)."""
+        shift_held = bool(getattr(event, "state", 0) & 0x0001)
+        if hasattr(event, "delta") and event.delta:
+            units = -1 * (event.delta // 120 or (1 if event.delta < 0 else -1))
+        elif getattr(event, "num", None) in (4, 5):
+            units = -1 if event.num == 4 else 1
+        else:
+            return
+        if shift_held:
+            self.scroll.canvas.xview_scroll(units, "units")
+        else:
+            # Trackpads fire bursts of small deltas: move the row window once per burst
+            if not self._add_wheel_units:
+                self.after_idle(self._flush_add_wheel)
+            self._add_wheel_units += units
+        return "break"
+
+    def _flush_add_wheel(self):
+        units, self._add_wheel_units = self._add_wheel_units, 0
+        if units:
+            self._add_yview("scroll", units, "units")
+
+    def _add_empty_frame(self):
+        if self._add_empty is None:
+            self._add_empty = ttk.Frame(self.scroll.viewPort, style="Modern.TFrame")
             ttk.Label(
-                empty_frame, 
+                self._add_empty, 
                 text="No rows staged for adding.\n\nCheck pending rows in 'Current Wells' tab to stage them here.",
                 style="Modern.TLabel",
                 font=('Segoe UI', 10),
                 justify="center"
             ).pack()
-            self._update_button_states()
-            return
+        return self._add_empty
 
-        table = ttk.Frame(self.scroll.viewPort, style="Modern.TFrame")
-        table.pack(fill="both", expand=True, padx=16, pady=8)
+    def _add_table_frame(self):
+        """The Add New table with its header row, built once."""
+        if self._add_table is not None:
+            return self._add_table
+
+        # Built unmapped and packed by the caller, so Tk lays the grid out in one pass
+        table = self._add_table = ttk.Frame(self.scroll.viewPort, style="Modern.TFrame")
 
         headers = ["", "GasIDREC", "PressuresIDREC", *ENTRY_FIELDS, *DROPDOWN_FIELDS, "Composite name"]
         col_widths = [36, 150, 150] + [200]*len(ENTRY_FIELDS) + [180]*len(DROPDOWN_FIELDS) + [240]
@@ -972,108 +1643,205 @@ class App(tk.Tk):
             hdr.grid(row=0, column=ci, sticky="nsew", padx=0, pady=0, ipadx=8, ipady=6)
             weight = 0 if ci in (0, 1, 2) else 1
             table.grid_columnconfigure(ci, minsize=col_widths[ci], weight=weight, uniform="addcols")
-
-        def cell(parent, r, c):
-            box = tk.Frame(parent, bd=1, relief="solid", bg=self.colors['surface'])
+        return table
+
+    def _show_add_row(self, k: int, i: int):
+        """Load staged record i into pooled row k (creating it if the pool is short)."""
+        if k < len(self._add_row_pool):
+            row = self._add_row_pool[k]
+            if row["index"] is None:
+                for box in row["cells"]:
+                    box.grid()
+        else:
+            row = self._make_add_row(k + 1)
+            self._add_row_pool.append(row)
+        row["index"] = i
+
+        # Only touch Tk when the shared options tuple was replaced since this row last saw it
+        for col, cb in row["combos"].items():
+            vals = self._combo_values.get(col, ())
+            if row["combo_vals"].get(col) is not vals:
+                cb.configure(values=vals)
+                row["combo_vals"][col] = vals
+
+        rec, state = self.new_ids[i], self.new_row_state[i]
+        if row["state"] is state:
+            return  # already showing this record
+
+        row["rec"] = rec
+        row["state"] = None  # mute _on_add_edit while the widgets are reloaded
+        row["selected"].set(state["selected"])
+        row["ids_canvas"].itemconfigure(row["gas_txt"], text=str(rec.get("GasIDREC") or ""))
+        row["ids_canvas"].itemconfigure(row["pres_txt"], text=str(rec.get("PressuresIDREC") or ""))
+        for col, e in row["entries"].items():
+            e.delete(0, "end")
+            e.insert(0, state["entries"][col])
+        for col, cb in row["combos"].items():
+            cb.set(state["dropdowns"][col])
+        row["comp_canvas"].itemconfigure(row["comp_txt"], text=state["comp"])
+        row["state"] = state
+
+    def _on_add_key(self, path: str, value: str) -> bool:
+        """validatecommand of every Add New Entry: %W and the proposed text %P."""
+        row, col = self._add_entry_of[path]
+        self._on_add_edit(row, "entries", col, value)
+        return True
+
+    def _on_add_edit(self, row: dict, kind: str, col: str, value: str):
+        """Copy an Add New input into its record's state; keep the composite in sync."""
+        state = row["state"]
+        if state is None:
+            return
+        state[kind][col] = value
+        if col in COMPOSITE_PARTS:
+            # Recompute once the keystroke burst is handled, not per character
+            if not self._comp_pending:
+                self.after_idle(self._flush_comp_syncs)
+            self._comp_pending[id(state)] = (state, row)
+
+    def _flush_comp_syncs(self):
+        """Recompute the composite for every Add New state edited since the last idle."""
+        pending, self._comp_pending = self._comp_pending, {}
+        for state, row in pending.values():
+            values = {**state["entries"], **state["dropdowns"]}
+            state["comp"] = compose_name(*(values.get(c, "") for c in COMPOSITE_PARTS)) or ""
+            if row["state"] is state:  # row may have been recycled for another record since
+                row["comp_canvas"].itemconfigure(row["comp_txt"], text=state["comp"])
+
+    def _make_add_row(self, r: int) -> dict:
+        """Create the widgets for one pooled Add New row at grid row r."""
+        table = self._add_table
+        cells = []
+
+        def cell(c):
+            box = tk.Frame(table, bd=1, relief="solid", bg=self.colors['surface'])
             box.grid(row=r, column=c, sticky="nsew", padx=0, pady=0)
+            cells.append(box)
             return box
 
-        for ri, rec in enumerate(self.new_ids, start=1):
-            # Select
-            var_sel = tk.BooleanVar(value=True)
-            
-            # Create callback to handle deselection
-            def on_checkbox_toggle(var=var_sel, rec_data=rec):
-                """Handle checkbox toggle - if unchecked, return to Current Wells."""
-                if not var.get():  # Checkbox was unchecked
-                    # Remove from staging
-                    pair = (str(rec_data.get("GasIDREC") or ""), str(rec_data.get("PressuresIDREC") or ""))
-                    self._staged_pairs.discard(pair)
-                    # Remove from new_ids
-                    self.new_ids = [r for r in self.new_ids 
-                                   if (str(r.get("GasIDREC") or ""), str(r.get("PressuresIDREC") or "")) != pair]
-                    # Rebuild Add New tab
-                    self.build_add_rows()
-                    # Reload to show it back in Current Wells as pending
-                    self.reload_all()
-                    # Switch back to Current Wells tab
-                    self.nb.select(self.tab_current)
-                    self.count_label.config(
-                        text=f"✓ Returned row to Current Wells tab"
-                    )
-                else:
-                    # Just update button states if checked
-                    self._update_button_states()
-            
-            cb = ttk.Checkbutton(cell(table, ri, 0), variable=var_sel, style="Modern.TCheckbutton", command=on_checkbox_toggle)
-            cb.pack(anchor="center")
-
-            # IDs
-            tk.Label(cell(table, ri, 1), text=str(rec.get("GasIDREC") or ""), anchor="w", 
-                    bg=self.colors['surface'], fg=self.colors['text_primary'], font=('Segoe UI', 9)).pack(fill="x", padx=6, pady=4)
-            tk.Label(cell(table, ri, 2), text=str(rec.get("PressuresIDREC") or ""), anchor="w",
-                    bg=self.colors['surface'], fg=self.colors['text_primary'], font=('Segoe UI', 9)).pack(fill="x", padx=6, pady=4)
-
-            # Entries
-            entry_vars = {}
-            col_index = 3
-            for col in ENTRY_FIELDS:
-                # Prefill from staged record if present (Well Name will now come through)
-                v = tk.StringVar(value=str(rec.get(col) or ""))
-                ttk.Entry(cell(table, ri, col_index), textvariable=v, style="Modern.TEntry").pack(fill="x", expand=True, padx=6, pady=4)
-                entry_vars[col] = v
-                col_index += 1
-
-            # Dropdowns
-            dropdown_vars = {}
-            for col in DROPDOWN_FIELDS:
-                v = tk.StringVar(value="")
-                ttk.Combobox(
-                    cell(table, ri, col_index),
-                    textvariable=v,
-                    values=self.dropdown_options.get(col, []),
-                    state="readonly",
-                    style="Modern.TCombobox"
-                ).pack(fill="x", expand=True, padx=6, pady=4)
-                dropdown_vars[col] = v
-                col_index += 1
-
-            # Composite
-            comp_var = tk.StringVar(value="")
-            ttk.Label(cell(table, ri, col_index), textvariable=comp_var, style="Modern.TLabel").pack(fill="x", expand=True, padx=6, pady=4)
-
-            # ---- Per-row callback with captured defaults (fixes late-binding bug) ----
-            def _sync(*_,
-                    entry_vars=entry_vars,
-                    dropdown_vars=dropdown_vars,
-                    comp_var=comp_var):
-                wname = entry_vars.get("Well Name").get() if "Well Name" in entry_vars else ""
-                layer = dropdown_vars.get("Layer Producer").get() if "Layer Producer" in dropdown_vars else ""
-                tech  = dropdown_vars.get("Completions Technology").get() if "Completions Technology" in dropdown_vars else ""
-                comp_var.set(compose_name(wname, layer, tech) or "")
-
-            # Attach traces so any change recomputes the composite (for THIS row)
-            if "Well Name" in entry_vars:
-                entry_vars["Well Name"].trace_add("write", _sync)
-            if "Layer Producer" in dropdown_vars:
-                dropdown_vars["Layer Producer"].trace_add("write", _sync)
-            if "Completions Technology" in dropdown_vars:
-                dropdown_vars["Completions Technology"].trace_add("write", _sync)
-
-            # Compute once initially
-            _sync()
-
-            # Stash row widgets/state
-            self.new_widgets.append({
-                "selected": var_sel,
-                "gas": rec.get("GasIDREC"),
-                "pres": rec.get("PressuresIDREC"),
-                "entries": entry_vars,
-                "dropdowns": dropdown_vars,
-                "comp_var": comp_var,
-            })
-
-        self._update_button_states()
+        row = {"index": None, "rec": None, "state": None, "cells": cells}
+        wheel = []  # widgets that should scroll the row window
+
+        # Select
+        var_sel = tk.BooleanVar(value=True)
+        cb = ttk.Checkbutton(cell(0), variable=var_sel, style="Modern.TCheckbutton",
+                             command=lambda: self._on_add_row_toggle(row))
+        cb.pack(anchor="center")
+        wheel.append(cb)
+
+        # IDs: both read-only cells are text items on one Canvas (no Frame+Label per cell)
+        ids_cv = self._text_canvas(r, 1, columnspan=2)
+        cells.append(ids_cv)
+        gas_txt, pres_txt = ids_cv.find_withtag("text")
+
+        # Entries: no StringVar/trace per cell; one validatecommand sees every edit
+        # (typing, paste, cut) with the new text and writes it into the row's state
+        if self._add_vcmd is None:
+            self._add_vcmd = (self.register(self._on_add_key), "%W", "%P")
+        entries = {}
+        col_index = 3
+        for col in ENTRY_FIELDS:
+            e = ttk.Entry(cell(col_index), style="Modern.TEntry",
+                          validate="key", validatecommand=self._add_vcmd)
+            e.pack(fill="x", expand=True, padx=6, pady=4)
+            self._add_entry_of[str(e)] = (row, col)
+            entries[col] = e
+            wheel.append(e)
+            col_index += 1
+
+        # Dropdowns (readonly, so a selection is the only way their text changes)
+        combos = {}
+        combo_vals = {}
+        for col in DROPDOWN_FIELDS:
+            combo_vals[col] = self._combo_values.get(col, ())
+            combos[col] = ttk.Combobox(
+                cell(col_index),
+                values=combo_vals[col],
+                state="readonly",
+                style="Modern.TCombobox"
+            )
+            combos[col].pack(fill="x", expand=True, padx=6, pady=4)
+            combos[col].bind(
+                "<<ComboboxSelected>>",
+                lambda e, c=col: self._on_add_edit(row, "dropdowns", c, e.widget.get()),
+            )
+            wheel.append(combos[col])
+            col_index += 1
+
+        # Composite (read-only, drawn like the IDs)
+        comp_cv = self._text_canvas(r, col_index)
+        cells.append(comp_cv)
+        comp_txt, = comp_cv.find_withtag("text")
+
+        # One class binding serves every pooled widget; ahead of the class tag so
+        # the wheel scrolls rows instead of cycling a Combobox value
+        for w in (*cells, *wheel):
+            tags = w.bindtags()
+            w.bindtags((tags[0], "AddRows", *tags[1:]))
+
+        # Stash row widgets
+        row.update({
+            "selected": var_sel,
+            "ids_canvas": ids_cv,
+            "gas_txt": gas_txt,
+            "pres_txt": pres_txt,
+            "entries": entries,
+            "combos": combos,
+            "combo_vals": combo_vals,
+            "comp_canvas": comp_cv,
+            "comp_txt": comp_txt,
+        })
+        return row
+
+    def _text_canvas(self, r: int, c: int, columnspan: int = 1) -> tk.Canvas:
+        """
+        Read-only Add New cells as one Canvas spanning `columnspan` grid columns:
+        one "text" item per column plus the cell borders, re-laid out on resize.
+        """
+        surface = self.colors['surface']
+        cv = tk.Canvas(self._add_table, width=1, height=1, bg=surface, highlightthickness=0, bd=0)
+        cv.grid(row=r, column=c, columnspan=columnspan, sticky="nsew", padx=0, pady=0)
+        for _ in range(columnspan):
+            cv.create_text(0, 0, anchor="w", font=('Segoe UI', 9), fill=self.colors['text_primary'], tags="text")
+            cv.create_rectangle(0, 0, 0, 0, fill=surface, outline="black", tags="box")
+
+        def _layout(e, cv=cv, n=columnspan):
+            w = e.width / n
+            texts, boxes = cv.find_withtag("text"), cv.find_withtag("box")
+            for i, (t, b) in enumerate(zip(texts, boxes)):
+                cv.coords(b, i * w, 0, (i + 1) * w - 1, e.height - 1)
+                cv.coords(t, i * w + 7, e.height / 2)
+                cv.tag_raise(t, b)  # each box hides the previous column's overflow
+        cv.bind("<Configure>", _layout)
+        return cv
+
+    def _on_add_row_toggle(self, row: dict):
+        """Handle checkbox toggle - if unchecked, return to Current Wells."""
+        if self._is_loading or self._operation_in_progress:
+            row["selected"].set(row["state"]["selected"])  # undo the click
+            return
+        row["state"]["selected"] = row["selected"].get()
+        if not row["selected"].get():  # Checkbox was unchecked
+            rec_data = row["rec"]
+            # Remove from staging
+            pair = (str(rec_data.get("GasIDREC") or ""), str(rec_data.get("PressuresIDREC") or ""))
+            self._staged_pairs.discard(pair)
+            # Remove from new_ids
+            self.new_ids = [r for r in self.new_ids 
+                           if (str(r.get("GasIDREC") or ""), str(r.get("PressuresIDREC") or "")) != pair]
+            self._sync_add_state()
+            # Rebuild Add New tab
+            self._schedule_add_rebuild()
+            # Reload to show it back in Current Wells as pending
+            self.reload_all()
+            # Switch back to Current Wells tab
+            self.nb.select(self.tab_current)
+            self.count_label.config(
+                text=f"✓ Returned row to Current Wells tab"
+            )
+        else:
+            # Just update button states if checked
+            self._update_button_states()
 
     # ---------------- Current Wells interactions ----------------
 
@@ -1122,6 +1890,10 @@ class App(tk.Tk):
         """
         Start editing a cell. This is called from both single-click and double-click handlers.
         """
+        # A load/save in flight would overwrite or drop the edit when it lands
+        if self._is_loading or self._operation_in_progress:
+            return
+
         # Get column ID for bbox calculation
         try:
             col_index = self.columns_present.index(col_name)
@@ -1134,39 +1906,33 @@ class App(tk.Tk):
         if not bbox:
             return
         
-        current_val = self.tree.set(item, col_name)
-        options = self.dropdown_options.get(col_name) if col_name in self.dropdown_options else None
+        current_val = self._get_cell(item, col_name)
+        options = self._combo_values.get(col_name) if col_name in self.dropdown_options else None
 
         # Close any previous editor
         self._close_editor(False)
 
         def _commit(value: str):
             # record change in grid
-            self.tree.set(item, col_name, value)
+            self._set_cell(item, col_name, value)
             self._pending_edits.setdefault(item, {})[col_name] = (value if value != "" else None)
             # keep Composite name in sync
-            if col_name in ("Well Name", "Layer Producer", "Completions Technology"):
-                comp = compose_name(
-                    self.tree.set(item, "Well Name"),
-                    self.tree.set(item, "Layer Producer"),
-                    self.tree.set(item, "Completions Technology"),
-                )
-                if "Composite name" in self.columns_present:
-                    self.tree.set(item, "Composite name", comp or "")
-                self._pending_edits.setdefault(item, {})["Composite name"] = comp
+            if col_name in COMPOSITE_PARTS:
+                comp = compose_name(*(self._get_cell(item, c) for c in COMPOSITE_PARTS))
+                # Nothing to stage (or redraw) if the name came out the same
+                if (comp or "") != (self._get_cell(item, "Composite name") or ""):
+                    if "Composite name" in self.columns_present:
+                        self._set_cell(item, "Composite name", comp or "")
+                    self._pending_edits.setdefault(item, {})["Composite name"] = comp
             self._update_button_states()
 
-        # Create the detached editor window over the cell
-        self._editor = CellEditor(
-            app=self,
-            tree=self.tree,
-            item=item,
-            col_name=col_name,
-            bbox=bbox,
-            options=options,            # None => Entry, list => Combobox
-            current_val=current_val,
-            on_commit=_commit,
-        )
+        # Re-show the pooled editor window over the cell (built on first use)
+        is_combo = options is not None   # None => Entry, list => Combobox
+        editor = self._editors.get(is_combo)
+        if editor is None:
+            editor = self._editors[is_combo] = CellEditor(self, self.tree, is_combo)
+        editor.open(item, col_name, bbox, options, current_val, _commit)
+        self._editor = editor
 
     def on_tree_double_click(self, event):
         """
@@ -1235,31 +2001,35 @@ class App(tk.Tk):
 
     def _toggle_item_checkbox(self, item: str):
         """Shared logic to toggle the ✓ cell, including staging pending rows."""
-        cur = self.tree.set(item, "Select")
+        if self._is_loading or self._operation_in_progress:
+            return
+        cur = self._get_cell(item, "Select")
         new = "☑" if cur != "☑" else "☐"
-        self.tree.set(item, "Select", new)
+        if self.tree.exists(item):
+            self.tree.set(item, "Select", new)
 
         # Pending rows get staged to Add New when checked
         if item in getattr(self, "_pending_row_ids", set()):
             if new == "☑":
-                gas = self.tree.set(item, "GasIDREC")
-                prs = self.tree.set(item, "PressuresIDREC")
+                gas = self._get_cell(item, "GasIDREC")
+                prs = self._get_cell(item, "PressuresIDREC")
                 pair = (str(gas or ""), str(prs or ""))
                 if pair not in self._staged_pairs:
                     self._staged_pairs.add(pair)
 
-                    well_name = self.tree.set(item, "Well Name")  # grab it from the row
+                    well_name = self._get_cell(item, "Well Name")  # grab it from the row
 
-                    self.new_ids.append({
+                    rec = {
                         "GasIDREC": pair[0],
                         "PressuresIDREC": pair[1],
                         "Well Name": well_name,
-                    })
-                    self.build_add_rows()
+                    }
+                    self.new_ids.append(rec)
+                    self._add_row_for(rec)
 
                 # remove from Current Wells view
                 try:
-                    self.tree.delete(item)
+                    self._remove_row(item)
                     self._pending_row_ids.discard(item)
                     self._pending_iid_to_pair.pop(item, None)
                 except Exception:
@@ -1339,7 +2109,7 @@ class App(tk.Tk):
             if shift_held:
                 self.tree.xview_scroll(units, "units")
             else:
-                self.tree.yview_scroll(units, "units")
+                self._virtual_yview("scroll", units, "units")
             return "break"
 
         # Linux X11: mouse wheel generates Button-4 (up) / Button-5 (down)
@@ -1348,7 +2118,7 @@ class App(tk.Tk):
             if shift_held:
                 self.tree.xview_scroll(units, "units")
             else:
-                self.tree.yview_scroll(units, "units")
+                self._virtual_yview("scroll", units, "units")
             return "break"
 
     # ---------------- Save edits ----------------
@@ -1380,79 +2150,134 @@ class App(tk.Tk):
         self._operation_in_progress = True
         self._set_loading_state(True)
         self.count_label.config(text=f"Saving {count} row(s)...")
-        self.update()
+        self.update_idletasks()
 
-        db_path = self.db_path_var.get()
-        table = self.table_var.get()
-        updated = 0
-        failed = 0
-        errors = []
+        db_path = self._db_path()
+        table = self._table_name()
 
-        try:
-            with connect_access(db_path) as conn:
-                for iid, payload in to_update.items():
-                    # Find Access row ID
-                    try:
-                        rec_id = int(iid)
-                    except Exception:
-                        row_vals = {c: self.tree.set(iid, c) for c in self.columns_present if c != "Select"}
-                        rec_id = find_existing_id(conn, table, row_vals.get("GasIDREC"), row_vals.get("PressuresIDREC"))
-
-                    if not rec_id:
-                        failed += 1
-                        errors.append(f"Row {iid}: Record not found")
-                        continue
-
-                    # Only update editable columns (and Composite name if available)
-                    safe_payload = {k: v for k, v in payload.items() if k in EDITABLE_FIELDS}
-
-                    wn = payload.get("Well Name", self.tree.set(iid, "Well Name"))
-                    lp = payload.get("Layer Producer", self.tree.set(iid, "Layer Producer"))
-                    ct = payload.get("Completions Technology", self.tree.set(iid, "Completions Technology"))
-                    comp = compose_name(wn, lp, ct)
-                    if comp is not None:
-                        safe_payload["Composite name"] = comp
-                        if "Composite name" in self.columns_present:
-                            self.tree.set(iid, "Composite name", comp)
+        # Everything the write needs is read from the grid here, on the Tk thread
+        edits: list[tuple] = []        # (iid, rec_id or None, gas, pres, safe_payload)
+        name_parts: list[tuple] = []   # (Well Name, Layer Producer, Completions Technology) per renaming edit
+        renamed: list[int] = []        # indexes into edits whose payload touches COMPOSITE_PARTS
+        for iid, payload in to_update.items():
+            row_vals = dict(zip(self.columns_present[1:], self._rows[self._iid_pos[iid]]))
+            try:
+                rec_id = int(iid)
+            except Exception:
+                rec_id = None  # resolved from the ID pair on the worker
+
+            # Only update editable columns (and Composite name if available)
+            safe_payload = {k: v for k, v in payload.items() if k in EDITABLE_FIELDS}
+
+            if any(c in payload for c in COMPOSITE_PARTS):
+                renamed.append(len(edits))
+                name_parts.append(tuple(payload.get(c, row_vals.get(c)) for c in COMPOSITE_PARTS))
+            edits.append((
+                iid, rec_id,
+                str(row_vals.get("GasIDREC") or ""), str(row_vals.get("PressuresIDREC") or ""),
+                safe_payload,
+            ))
+
+        # Composite names, only for rows whose name parts changed, in one vectorised pass
+        comps = compose_name_vec(pd.DataFrame(name_parts, columns=COMPOSITE_PARTS)) if renamed else []
+        for i, comp in zip(renamed, comps):
+            iid, _rec_id, _gas, _pres, safe_payload = edits[i]
+            if comp is not None:
+                safe_payload["Composite name"] = comp
+                if "Composite name" in self.columns_present:
+                    self._set_cell(iid, "Composite name", comp)
 
-                    try:
-                        update_record(conn, table, rec_id, safe_payload)
-                        updated += 1
-                    except Exception as e:
-                        failed += 1
-                        errors.append(f"Row {iid}: {str(e)}")
-
-                conn.commit()
-
-            # Clear pending edits for saved rows
-            for iid in list(self._checked):
-                self._pending_edits.pop(iid, None)
-
-            if failed > 0:
-                error_msg = "\n".join(errors[:5])  # Show first 5 errors
-                if len(errors) > 5:
-                    error_msg += f"\n... and {len(errors) - 5} more"
-                messagebox.showwarning(
-                    "Save Completed with Errors",
-                    f"Updated: {updated}\nFailed: {failed}\n\nErrors:\n{error_msg}"
-                )
-            else:
-                messagebox.showinfo("Save Complete", f"Successfully updated {updated} row(s).")
-            
-            self.reload_all()
+        dropdown_touched = any(col in DROPDOWN_FIELDS for *_, p in edits for col in p)
+        self._run_io(
+            save_edits, db_path, table, edits, self._report_io,
+            on_done=lambda fut: self._finish_save(fut, edits, dropdown_touched),
+        )
+
+    def _finish_save(self, fut, edits: list[tuple], dropdown_touched: bool):
+        """
+        Tk-thread half of save_checked_edits. The grid already shows the edited
+        values, so saved rows are patched into df_current in place (no reload),
+        falling back to a forced reload if the patch fails.
+        """
+        self._operation_in_progress = False
+        self._set_loading_state(False)
+        try:
+            saved, failed, errors = fut.result()
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save changes:\n{e}")
-        finally:
-            self._operation_in_progress = False
-            self._set_loading_state(False)
             self._update_button_states()
+            return
+        updated = len(saved)
+
+        payloads = {iid: payload for iid, _rec_id, _gas, _pres, payload in edits}
+        try:
+            self._patch_saved_rows(saved, payloads)
+            if dropdown_touched:
+                self._set_dropdown_options(get_unique_options(self.df_current))
+            patched = True
+        except Exception as e:
+            # The write is already committed; re-read it rather than leave df_current stale
+            log(f"[DB] Could not patch saved rows into memory: {e}")
+            patched = False
+
+        # Saved rows: drop their pending edits and uncheck them; failed rows stay checked for a retry
+        for iid, _rec_id in saved:
+            self._pending_edits.pop(iid, None)
+            self._checked.discard(iid)
+            if self.tree.exists(iid):
+                self.tree.set(iid, "Select", "☐")
+        self._update_button_states()
+        self.count_label.config(text=f"✓ Saved {updated} row(s)")
+
+        if failed > 0:
+            error_msg = "\n".join(errors[:5])  # Show first 5 errors
+            if len(errors) > 5:
+                error_msg += f"\n... and {len(errors) - 5} more"
+            messagebox.showwarning(
+                "Save Completed with Errors",
+                f"Updated: {updated}\nFailed: {failed}\n\nErrors:\n{error_msg}"
+            )
+        else:
+            messagebox.showinfo("Save Complete", f"Successfully updated {updated} row(s).")
+
+        if not patched:
+            self.reload_all(force=True)
+
+    def _patch_saved_rows(self, saved: list[tuple[str, int]], payloads: dict[str, dict]):
+        """Write saved payloads into self.df_current, located by Access ID."""
+        df = self.df_current
+        if df is None or "ID" not in df.columns:
+            return
+        pos = {rid: i for i, rid in enumerate(df["ID"].tolist())}
+        categorical_touched = set()
+        for iid, rec_id in saved:
+            r = pos.get(rec_id)
+            if r is None:
+                continue
+            for col, val in payloads[iid].items():
+                if col not in df.columns:
+                    continue
+                dtype = df[col].dtype
+                if isinstance(dtype, pd.CategoricalDtype):
+                    categorical_touched.add(col)
+                    if val is not None and val not in dtype.categories:
+                        df[col] = df[col].cat.add_categories([val])
+                elif pd.api.types.is_numeric_dtype(dtype):
+                    val = pd.to_numeric(val, errors="coerce")
+                    # An all-integer column loads as int64, which can't hold a fraction or a blank
+                    if pd.api.types.is_integer_dtype(dtype) and not (pd.notna(val) and float(val).is_integer()):
+                        df[col] = df[col].astype("float64")
+                df.iat[r, df.columns.get_loc(col)] = val
+        # A value no row uses after the edit shouldn't linger as a dropdown option
+        for col in categorical_touched:
+            df[col] = df[col].cat.remove_unused_categories()
 
     
     # ---------------- Export Current Wells --------------------------
     
     def export_current_wells(self):
         """
-        Export the Current Wells treeview exactly as displayed (order + current cell values).
+        Export the Current Wells grid exactly as displayed (order + current cell values).
         Includes unsaved edits that are visible in the grid.
         """
         if self._is_loading or self.df_current is None:
@@ -1462,7 +2287,7 @@ class App(tk.Tk):
         self._close_editor(commit=True)
 
         # Choose file
-        default_name = f"{self.table_var.get()}_current_wells"
+        default_name = f"{self._table_name()}_current_wells"
         path = filedialog.asksaveasfilename(
             title="Export Current Wells",
             defaultextension=".xlsx",
@@ -1475,22 +2300,16 @@ class App(tk.Tk):
         if not path:
             return
 
-        # Build rows from the tree in displayed order
-        rows = []
         # Export these columns (skip the checkbox column)
         export_cols = [c for c in self.columns_present if c != "Select"]
 
-        for iid in self.tree.get_children(""):
-            row = {}
-            for col in export_cols:
-                row[col] = self.tree.set(iid, col)
-            rows.append(row)
-
-        if not rows:
+        # Rows in displayed order, straight from the grid's backing rows
+        # (the Treeview itself only holds the visible window)
+        if not self._rows:
             messagebox.showinfo("No Data", "No data to export.")
             return
 
-        df = pd.DataFrame(rows, columns=export_cols)
+        df = pd.DataFrame(self._rows, columns=export_cols)
 
         try:
             if path.lower().endswith(".csv"):
@@ -1526,22 +2345,18 @@ class App(tk.Tk):
         if self._is_loading or self._operation_in_progress:
             return
 
+        self._flush_comp_syncs()  # composites still waiting on idle
         rows = []
-        staged_pairs_selected = []  # to track which staged rows were chosen this time
-        for item in self.new_widgets:
-            if not item["selected"].get():
+        for rec, state in zip(self.new_ids, self.new_row_state):
+            if not state["selected"]:
                 continue
-            payload = {
-                "GasIDREC": item["gas"],
-                "PressuresIDREC": item["pres"],
-            }
-            for col, v in item["entries"].items():
-                payload[col] = v.get().strip() or None
-            for col, v in item["dropdowns"].items():
-                payload[col] = v.get().strip() or None
-            payload["Composite name"] = item["comp_var"].get() or None
-            rows.append(payload)
-            staged_pairs_selected.append((str(item["gas"] or ""), str(item["pres"] or "")))
+            rows.append({
+                "GasIDREC": rec.get("GasIDREC"),
+                "PressuresIDREC": rec.get("PressuresIDREC"),
+                **{col: v.strip() or None for col, v in state["entries"].items()},
+                **{col: v.strip() or None for col, v in state["dropdowns"].items()},
+                "Composite name": state["comp"] or None,
+            })
 
         if not rows:
             messagebox.showinfo("Nothing Selected", "Please check the rows you want to add/update, then try again.")
@@ -1557,93 +2372,99 @@ class App(tk.Tk):
         self._operation_in_progress = True
         self._set_loading_state(True)
         self.count_label.config(text=f"Processing {len(rows)} row(s)...")
-        self.update()
+        self.update_idletasks()
 
-        db_path = self.db_path_var.get()
-        table = self.table_var.get()
+        db_path = self._db_path()
+        table = self._table_name()
 
-        updated = 0
-        inserted = 0
-        skipped = 0
-        processed_ok_pairs: list[tuple] = []
-        errors = []
+        # Duplicate names are confirmed on the Tk thread before the write starts
+        self._run_io(
+            fetch_existing_well_names, db_path, table, [r.get("Well Name") for r in rows],
+            on_done=lambda fut: self._confirm_update(fut, db_path, table, rows),
+        )
 
+    def _confirm_update(self, fut, db_path: str, table: str, rows: list[dict]):
+        """
+        Ask about duplicate Well Names, then hand the remaining rows to the worker.
+        Writes to the db_path/table the duplicate check ran against, not whatever
+        the (still editable) toolbar fields hold now.
+        """
         try:
-            with connect_access(db_path) as conn:
-                to_insert = []
-                for r in rows:
-                    wn = r.get("Well Name")
-                    if wn:
-                        cur = conn.cursor()
-                        cur.execute(f"SELECT COUNT(1) FROM [{table}] WHERE [Well Name] = ?", (wn,))
-                        if cur.fetchone()[0] > 0:
-                            if not messagebox.askyesno("Duplicate Well Name", f"'{wn}' already exists. Continue with this row?"):
-                                skipped += 1
-                                continue
-
-                    rec_id = find_existing_id(conn, table, r.get("GasIDREC"), r.get("PressuresIDREC"))
-                    pair = (str(r.get("GasIDREC") or ""), str(r.get("PressuresIDREC") or ""))
-                    if rec_id:
-                        try:
-                            update_record(conn, table, rec_id, r)
-                            updated += 1
-                            processed_ok_pairs.append(pair)
-                        except Exception as e:
-                            errors.append(f"Update failed for {pair}: {e}")
-                            # Continue with other rows
-                    else:
-                        to_insert.append((r, pair))
-
-                if to_insert:
-                    try:
-                        insert_records(conn, table, [r for r, _pair in to_insert])
-                        inserted += len(to_insert)
-                        processed_ok_pairs.extend([pair for _r, pair in to_insert])
-                    except Exception as e:
-                        errors.append(f"Insert failed: {e}")
-                        # Don't return, show errors at end
-                conn.commit()
-
-            # Remove successfully processed pairs from staging (self.new_ids / self._staged_pairs)
-            if processed_ok_pairs:
-                keep = []
-                processed_set = set(processed_ok_pairs)
-                for rec in self.new_ids:
-                    pair = (str(rec.get("GasIDREC") or ""), str(rec.get("PressuresIDREC") or ""))
-                    if pair not in processed_set:
-                        keep.append(rec)
-                    else:
-                        # also drop from the staged set
-                        self._staged_pairs.discard(pair)
-                self.new_ids = keep
-
-            # Show results
-            if errors:
-                error_msg = "\n".join(errors[:5])
-                if len(errors) > 5:
-                    error_msg += f"\n... and {len(errors) - 5} more"
-                messagebox.showwarning(
-                    "Update Completed with Errors",
-                    f"Updated: {updated}\nInserted: {inserted}\nSkipped: {skipped}\n\nErrors:\n{error_msg}"
-                )
-            else:
-                messagebox.showinfo(
-                    "Update Complete",
-                    f"Successfully processed:\n• Updated: {updated}\n• Inserted: {inserted}\n• Skipped: {skipped}"
-                )
+            existing_names = fut.result()
+        except Exception as e:
+            self._end_update()
+            messagebox.showerror("Update Error", f"Failed to process updates:\n{e}")
+            return
+        # Access matched the IN (...) case-insensitively and returns the stored spelling
+        existing_names = {n.strip().casefold() for n in existing_names if n}
 
-            # Rebuild both tabs
-            self.reload_all()
+        keep = []
+        skipped = 0
+        for r in rows:
+            wn = r.get("Well Name")
+            if wn and wn.strip().casefold() in existing_names:
+                if not messagebox.askyesno("Duplicate Well Name", f"'{wn}' already exists. Continue with this row?"):
+                    skipped += 1
+                    continue
+            keep.append(r)
+
+        if not keep:
+            self._end_update()
+            messagebox.showinfo(
+                "Update Complete",
+                f"Successfully processed:\n• Updated: 0\n• Inserted: 0\n• Skipped: {skipped}"
+            )
+            return
+
+        self._run_io(
+            upsert_staged_rows, db_path, table, keep, self._report_io,
+            on_done=lambda fut: self._finish_update(fut, skipped),
+        )
+
+    def _finish_update(self, fut, skipped: int):
+        """Tk-thread half of do_update: unstage processed rows, report, reload."""
+        try:
+            updated, inserted, processed_ok_pairs, errors = fut.result()
         except Exception as e:
+            self._end_update()
             messagebox.showerror("Update Error", f"Failed to process updates:\n{e}")
-        finally:
-            self._operation_in_progress = False
-            self._set_loading_state(False)
-            self._update_button_states()
+            return
+
+        # Remove successfully processed pairs from staging (self.new_ids / self._staged_pairs)
+        if processed_ok_pairs:
+            self.new_ids = [
+                rec for rec in self.new_ids
+                if (str(rec.get("GasIDREC") or ""), str(rec.get("PressuresIDREC") or "")) not in processed_ok_pairs
+            ]
+            self._staged_pairs -= processed_ok_pairs
+            self._sync_add_state()
+
+        self._end_update()
+
+        # Show results
+        if errors:
+            error_msg = "\n".join(errors[:5])
+            if len(errors) > 5:
+                error_msg += f"\n... and {len(errors) - 5} more"
+            messagebox.showwarning(
+                "Update Completed with Errors",
+                f"Updated: {updated}\nInserted: {inserted}\nSkipped: {skipped}\n\nErrors:\n{error_msg}"
+            )
+        else:
+            messagebox.showinfo(
+                "Update Complete",
+                f"Successfully processed:\n• Updated: {updated}\n• Inserted: {inserted}\n• Skipped: {skipped}"
+            )
+
+        # Rebuild both tabs (loading state is already cleared, so this isn't a no-op)
+        self.reload_all()
+
+    def _end_update(self):
+        self._operation_in_progress = False
+        self._set_loading_state(False)
+        self._update_button_states()
 
 
 if __name__ == "__main__":
-    import warnings
-    warnings.filterwarnings("ignore", category=UserWarning, module="pandas")
     app = App()
     app.mainloop()
\ No newline at end of file